@@ -8,6 +8,9 @@ from qt_material import apply_stylesheet, QtStyleTools
 from src.environment import environment
 from src.handlers.bulk_handler import BulkHandler
 from src.handlers.file_handler import FileHandler
+from src.models.search_index import SearchIndex
+from src.models.utility import format_value
+from src.tasks.index_task import IndexTask
 from src.types import MerData
 from src.utility import modify_environment
 from src.views.bulk_export_dlg import Settings
@@ -23,6 +26,9 @@ class MerController(QObject, QtStyleTools):
         # model
         self.mer_data: MerData = dict()
 
+        # the imported Mer is indexed in the background for searching
+        self.index_tasks: List[IndexTask] = list()
+
         # view
         self.view: MerView = MerView()
 
@@ -100,6 +106,8 @@ class MerController(QObject, QtStyleTools):
         # initiate view with mer data
         self.set_mer_view(converted_data)
 
+        self.start_indexing()
+
     def on_bulk_success(self):
         # enable menu's when all tasks are finished
         if self.bulk_handler.all_tasks_finished():
@@ -112,16 +120,32 @@ class MerController(QObject, QtStyleTools):
 
         tact_scenario_txt = 'Tactical Scenarios:'
 
+        tact_scenario = converted_data['TACTICAL_SCENARIO']
+
         # get all tactical scenario's from importer mers, for showing in view
-        for index, row in converted_data['TACTICAL_SCENARIO'].original_df.iterrows():
+        for index, row in tact_scenario.original_df.iterrows():
             tact_scenario_txt += \
                 'Lat {0}, Long {1}'.format(
-                    row['GRID CENTER LAT'],
-                    row['GRID CENTER LONG']
+                    *[format_value(name, row[name], tact_scenario.formats.get(name))
+                      for name in ['GRID CENTER LAT', 'GRID CENTER LONG']]
                 )
 
         self.view.import_success(tact_scenario_txt)
 
+    def start_indexing(self) -> None:
+        task: IndexTask = IndexTask(self.mer_data)
+        task.task_finished.connect(lambda x: self.on_index_success(task, x))
+        task.task_failed.connect(self.view.show_status_message)
+        task.finished.connect(lambda: self.index_tasks.remove(task))
+
+        self.index_tasks.append(task)
+        task.start()
+
+    def on_index_success(self, task: IndexTask, search_index: SearchIndex) -> None:
+        # a new Mer may have been imported while indexing
+        if task.data is self.mer_data:
+            self.view.set_search_index(search_index)
+
     def reset_mer(self) -> None:
         # reset view and data
         if bool(self.mer_data):
@@ -1,12 +1,13 @@
 import re
-from typing import List
+from typing import List, Dict
 
 from pandas import DataFrame
 
-from src.converters.utility import convert_degrees_to_coordinates
+from src.converters.utility import validate_positions, LATITUDE, LONGITUDE
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
 
+import numpy as np
 import pandas as pd
 
 from src.log import get_logger
@@ -25,6 +26,13 @@ class DegreesToCoordinatesConverter(IConverter):
             self.logger.error(get_exception(e))
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        return [col for lat_col in get_lat_cols(scientific_cols) for col in (lat_col, get_long_col(lat_col))]
+
+    def get_formats(self, name: str, columns: List[str], scientific_cols: List[str]) -> Dict[str, str]:
+        return {col: display_format for lat_col in get_lat_cols(scientific_cols)
+                for col, display_format in ((lat_col, LATITUDE), (get_long_col(lat_col), LONGITUDE))}
+
 
 def convert_lat_long_cols(df: DataFrame, scientific_cols: List[str]) -> DataFrame:
     df_to_convert: DataFrame = df.copy()
@@ -33,17 +41,22 @@ def convert_lat_long_cols(df: DataFrame, scientific_cols: List[str]) -> DataFram
 
     for lat_col in lat_cols:
         lat_pos: str = lat_col
-        long_pos: str = lat_col.replace('LAT', 'LONG')
-        if 'DIP' in lat_col:
-            long_pos = lat_col.replace('X', 'Y')
+        long_pos: str = get_long_col(lat_col)
 
         if bool(lat_pos) and bool(long_pos):
-            df_to_convert[[lat_pos, long_pos]] = df_to_convert[[lat_pos, long_pos]].apply(
-                lambda row, lat=lat_pos, long=long_pos:
-                convert_degrees_to_coordinates(
-                    row[lat],
-                    row[long])
-                if pd.notnull(row).any() else row, axis=1).apply(pd.Series)
+            lat, long, invalid = validate_positions(
+                pd.to_numeric(df_to_convert[lat_pos], errors='coerce').to_numpy(dtype=float),
+                pd.to_numeric(df_to_convert[long_pos], errors='coerce').to_numpy(dtype=float))
+
+            # positions without any value are not worth logging
+            invalid -= np.count_nonzero(df_to_convert[[lat_pos, long_pos]].isna().all(axis=1))
+            if invalid > 0:
+                DegreesToCoordinatesConverter.logger.error(
+                    '{0} positions of {1}, {2} could not be converted'.format(invalid, lat_pos, long_pos))
+
+            # the columns keep the degrees, they are shown as coordinates
+            df_to_convert[lat_pos] = lat
+            df_to_convert[long_pos] = long
 
     return df_to_convert
 
@@ -54,3 +67,10 @@ def get_lat_cols(scientific_columns: List[str]) -> List:
 
     return lat_cols
 
+
+def get_long_col(lat_col: str) -> str:
+    if 'DIP' in lat_col:
+        return lat_col.replace('X', 'Y')
+
+    return lat_col.replace('LAT', 'LONG')
+
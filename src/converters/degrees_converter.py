@@ -1,13 +1,15 @@
-from typing import List, Union
+from typing import List, Union, Dict
 
 from pandas import DataFrame
 
+from src.converters.utility import DEGREES
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
 
 from src.log import get_logger
 import re
 import numpy as np
+import pandas as pd
 
 
 class DegreesConverter(IConverter):
@@ -23,13 +25,30 @@ class DegreesConverter(IConverter):
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        return get_degrees_cols(scientific_cols)
+
+    def get_formats(self, name: str, columns: List[str], scientific_cols: List[str]) -> Dict[str, str]:
+        return dict.fromkeys(get_degrees_cols(scientific_cols), DEGREES)
+
 
 def convert_degrees_cols(df: DataFrame, scientific_cols):
     df_to_convert: DataFrame = df.copy()
     degree_cols = get_degrees_cols(scientific_cols)
 
     for col in degree_cols:
-        df_to_convert[col] = df_to_convert[col].apply(convert_degrees)
+        degrees: np.ndarray = pd.to_numeric(df_to_convert[col], errors='coerce').to_numpy(dtype=float)
+
+        # the columns keep whole degrees, they are shown with 3 numbers
+        with np.errstate(invalid='ignore'):
+            degrees = np.rint(degrees) % 360
+
+        # missing values stay missing, other values which can not be converted are counted
+        invalid: int = int(np.count_nonzero(np.isnan(degrees) & df_to_convert[col].notna().to_numpy()))
+        if invalid > 0:
+            DegreesConverter.logger.error('{0} values of {1} could not be converted'.format(invalid, col))
+
+        df_to_convert[col] = pd.Series(degrees, index=df_to_convert.index)
 
     return df_to_convert
 
@@ -0,0 +1,201 @@
+import math
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from src.dataclasses.grid_centers import GridCenters
+
+# major semi-axis WGS-84
+WGS84_A: float = 6378137.000
+# first eccentricity WGS-84 (e, not e²)
+WGS84_E: float = 0.08181919084262
+# flattening WGS-84
+WGS84_F: float = 1 / 298.257223563
+# minor semi-axis WGS-84
+WGS84_B: float = (1 - WGS84_F) * WGS84_A
+
+# yards in a meter
+YARDS_PER_METER: float = 1.09361
+
+
+# --- GRID CENTERS ---
+def create_grid_centers(tact_scenario: DataFrame) -> GridCenters:
+    """
+    Precomputes the grid center of every reference in the tactical scenario,
+    the first tactical scenario of a reference is used
+    """
+    grid_centers: DataFrame = tact_scenario.drop_duplicates(subset='REFERENCE')
+
+    return get_grid_centers(pd.Index(grid_centers['REFERENCE']),
+                            pd.to_numeric(grid_centers['GRID CENTER LAT'], errors='coerce').to_numpy(dtype=float),
+                            pd.to_numeric(grid_centers['GRID CENTER LONG'], errors='coerce').to_numpy(dtype=float))
+
+
+def get_grid_centers(references: pd.Index, lat_deg: np.ndarray, long_deg: np.ndarray) -> GridCenters:
+    """
+    Returns grid centers (degrees) with sin and cos of their latitude and the radius of curvature at their latitude
+    """
+    lat_rad = lat_deg * math.pi / 180
+    sin_lat = np.sin(lat_rad)
+
+    rho = WGS84_A * np.sqrt(1 - ((WGS84_E * WGS84_E) * sin_lat * sin_lat))
+
+    return GridCenters(references, lat_deg, long_deg, sin_lat, np.cos(lat_rad), rho)
+
+
+# --- YARDS OFFSET TO DEGREES ---
+def convert_yards_to_degrees_array(lat_yards: np.ndarray, long_yards: np.ndarray,
+                                   tact_lat_deg: np.ndarray, tact_long_deg: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts whole columns of X and Y yards relative to the grid center (degrees) of every position to degrees
+    """
+    grid_centers: GridCenters = get_grid_centers(pd.RangeIndex(len(lat_yards)), np.asarray(tact_lat_deg, dtype=float),
+                                                 np.asarray(tact_long_deg, dtype=float))
+
+    return convert_yards_to_positions(lat_yards, long_yards, grid_centers)
+
+
+def convert_yards_to_degrees(lat_yards, long_yards, tact_lat_deg, tact_long_deg):
+    lat, long = convert_yards_to_degrees_array(np.array([lat_yards], dtype=float), np.array([long_yards], dtype=float),
+                                               np.array([tact_lat_deg]), np.array([tact_long_deg]))
+
+    return lat[0], long[0]
+
+
+def convert_yards_to_positions(lat_yards: np.ndarray, long_yards: np.ndarray,
+                               grid_centers: GridCenters) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Moves the grid center of every position over an X (north) and Y (east) offset in yards to degrees.
+    Positions which can not be converted (missing values, outside the domain of asin) become NaN
+    """
+    sin_lat, cos_lat, rho = grid_centers.sin_lat, grid_centers.cos_lat, grid_centers.rho
+    tact_long_deg = grid_centers.long_deg
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Position (x and y) of the OwnHelo compared to the Tactical Scenario in meters
+        x, y = lat_yards / YARDS_PER_METER, long_yards / YARDS_PER_METER
+
+        alpha = np.arctan(x / y)
+        beta = np.sign(y) * np.arctan(np.sqrt(x * x + y * y) / rho)
+
+        lat_deg = (180 / math.pi) * np.arcsin((sin_lat * np.cos(beta)) + (cos_lat * np.sin(beta) * np.cos(alpha)))
+        lat_rad = lat_deg * math.pi / 180
+
+        long_deg = tact_long_deg + (180 / math.pi) * np.arcsin(np.sin(alpha) * np.sin(beta) / np.cos(lat_rad))
+
+    # if data is missing, the position is not converted
+    missing: np.ndarray = (lat_yards == 0) | (long_yards == 0)
+
+    return np.where(missing, lat_yards, lat_deg), np.where(missing, long_yards, long_deg)
+
+
+# --- GEODESIC DESTINATION ---
+def move_geo_points(lat: np.ndarray, long: np.ndarray, bearing: np.ndarray,
+                    km: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Moves points (degrees) over a distance in km along a bearing in degrees, for whole arrays at once.
+    Vincenty's direct formula on WGS-84, which agrees with geopy's geodesic within a millimetre
+    """
+    a = WGS84_A
+    f = WGS84_F
+    b = WGS84_B
+
+    s = np.asarray(km, dtype=float) * 1000
+    alpha1 = np.radians(bearing)
+    sin_alpha1, cos_alpha1 = np.sin(alpha1), np.cos(alpha1)
+
+    # reduced latitude
+    u1 = np.arctan((1 - f) * np.tan(np.radians(lat)))
+    sin_u1, cos_u1 = np.sin(u1), np.cos(u1)
+
+    sigma1 = np.arctan2(np.tan(u1), cos_alpha1)
+    sin_alpha = cos_u1 * sin_alpha1
+    cos2_alpha = 1 - sin_alpha * sin_alpha
+
+    u2 = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    big_b = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+
+    # angular distance on the sphere, iterate until it does not change anymore
+    sigma = s / (b * big_a)
+    for _ in range(100):
+        cos2_sigma_m = np.cos(2 * sigma1 + sigma)
+        sin_sigma, cos_sigma = np.sin(sigma), np.cos(sigma)
+
+        delta_sigma = big_b * sin_sigma * (cos2_sigma_m + big_b / 4 * (
+            cos_sigma * (-1 + 2 * cos2_sigma_m * cos2_sigma_m) - big_b / 6 * cos2_sigma_m *
+            (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2_sigma_m * cos2_sigma_m)))
+
+        previous_sigma, sigma = sigma, s / (b * big_a) + delta_sigma
+        if not np.any(np.abs(sigma - previous_sigma) > 1e-12):
+            break
+
+    cos2_sigma_m = np.cos(2 * sigma1 + sigma)
+    sin_sigma, cos_sigma = np.sin(sigma), np.cos(sigma)
+
+    x = sin_u1 * sin_sigma - cos_u1 * cos_sigma * cos_alpha1
+    lat2 = np.arctan2(sin_u1 * cos_sigma + cos_u1 * sin_sigma * cos_alpha1,
+                      (1 - f) * np.sqrt(sin_alpha * sin_alpha + x * x))
+
+    lambda_ = np.arctan2(sin_sigma * sin_alpha1, cos_u1 * cos_sigma - sin_u1 * sin_sigma * cos_alpha1)
+    c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+    big_l = lambda_ - (1 - c) * f * sin_alpha * (
+        sigma + c * sin_sigma * (cos2_sigma_m + c * cos_sigma * (-1 + 2 * cos2_sigma_m * cos2_sigma_m)))
+
+    long2 = long + np.degrees(big_l)
+    long2 = np.where(np.abs(long2) > 180, (long2 + 180) % 360 - 180, long2)
+
+    return np.degrees(lat2), long2
+
+
+# --- GEODESIC DISTANCE ---
+def get_distances(lat1: np.ndarray, long1: np.ndarray, lat2: np.ndarray, long2: np.ndarray) -> np.ndarray:
+    """
+    Returns the distance in km between points (degrees), for whole arrays at once.
+    Vincenty's inverse formula on WGS-84, it does not converge for (nearly) antipodal points
+    """
+    a = WGS84_A
+    f = WGS84_F
+    b = WGS84_B
+
+    big_l = np.radians(np.asarray(long2, dtype=float) - np.asarray(long1, dtype=float))
+
+    # reduced latitudes
+    reduced_lat1 = np.arctan((1 - f) * np.tan(np.radians(lat1)))
+    reduced_lat2 = np.arctan((1 - f) * np.tan(np.radians(lat2)))
+    sin_u1, cos_u1 = np.sin(reduced_lat1), np.cos(reduced_lat1)
+    sin_u2, cos_u2 = np.sin(reduced_lat2), np.cos(reduced_lat2)
+
+    # longitude on the auxiliary sphere, iterate until it does not change anymore
+    lambda_ = big_l
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for _ in range(100):
+            sin_lambda, cos_lambda = np.sin(lambda_), np.cos(lambda_)
+
+            sin_sigma = np.sqrt((cos_u2 * sin_lambda) ** 2 + (cos_u1 * sin_u2 - sin_u1 * cos_u2 * cos_lambda) ** 2)
+            cos_sigma = sin_u1 * sin_u2 + cos_u1 * cos_u2 * cos_lambda
+            sigma = np.arctan2(sin_sigma, cos_sigma)
+
+            # coincident points and points on the equator
+            sin_alpha = np.where(sin_sigma == 0, 0, cos_u1 * cos_u2 * sin_lambda / sin_sigma)
+            cos2_alpha = 1 - sin_alpha * sin_alpha
+            cos2_sigma_m = np.where(cos2_alpha == 0, 0, cos_sigma - 2 * sin_u1 * sin_u2 / cos2_alpha)
+
+            c = f / 16 * cos2_alpha * (4 + f * (4 - 3 * cos2_alpha))
+
+            previous_lambda, lambda_ = lambda_, big_l + (1 - c) * f * sin_alpha * (
+                sigma + c * sin_sigma * (cos2_sigma_m + c * cos_sigma * (-1 + 2 * cos2_sigma_m * cos2_sigma_m)))
+            if not np.any(np.abs(lambda_ - previous_lambda) > 1e-12):
+                break
+
+    u2 = cos2_alpha * (a * a - b * b) / (b * b)
+    big_a = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    big_b = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+
+    delta_sigma = big_b * sin_sigma * (cos2_sigma_m + big_b / 4 * (
+        cos_sigma * (-1 + 2 * cos2_sigma_m * cos2_sigma_m) - big_b / 6 * cos2_sigma_m *
+        (-3 + 4 * sin_sigma * sin_sigma) * (-3 + 4 * cos2_sigma_m * cos2_sigma_m)))
+
+    return b * big_a * (sigma - delta_sigma) / 1000
@@ -1,3 +1,5 @@
+from typing import List
+
 from pandas import DataFrame
 
 from src.interfaces.converter_interface import IConverter
@@ -19,7 +21,9 @@ class ReferenceConverter(IConverter):
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        return ['REFERENCE'] if 'REFERENCE' in columns else []
+
 
 def remove_reference_column(df: DataFrame):
-    df.drop('REFERENCE', axis=1, inplace=True)
-    return df
+    return df.drop('REFERENCE', axis=1)
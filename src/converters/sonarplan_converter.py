@@ -1,7 +1,9 @@
-import geopy
-from geopy.distance import geodesic
+from typing import List, Tuple, Dict
+
+import numpy as np
 from pandas import DataFrame
 
+from src.converters.geodesy import move_geo_points
 from src.converters.utility import convert_dist
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
@@ -26,6 +28,10 @@ class SonarPlanConverter(IConverter):
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        # a sonar plan is a handful of rows, the dip layout is left to the conversion
+        return list(columns) if name == 'SONAR_PLAN_44' else []
+
 
 dip_schemes = {
     '2': [
@@ -67,44 +73,68 @@ dip_degrees_schemes = {
 }
 
 
-def convert_sonar_plan_44(df: DataFrame, scientific_cols):
-    df_to_convert: DataFrame = df.copy()
+def create_dip_table(heli_count: str) -> List[List[Tuple[float, float]]]:
+    """
+    Returns the bearing (degrees) and distance (km) from the reference point of every dip of every heli
+    """
+    return [[((degrees + heli_degrees) % 360, convert_dist(nm, 'nm', 'km')) for degrees, nm in dip_schemes[heli_count]]
+            for heli_degrees in dip_degrees_schemes[heli_count]]
 
-    helis = get_dip_cols(scientific_cols)
-    heli_count = str(len(helis))
 
-    scheme = dip_schemes[heli_count]
-    degrees_scheme = dip_degrees_schemes[heli_count]
+# the dip layout is the same for every row, so it is computed once per heli count
+dip_tables: Dict[str, List[List[Tuple[float, float]]]] = {
+    heli_count: create_dip_table(heli_count) for heli_count in dip_schemes}
 
-    # For every row do:
-    for i, row in df_to_convert.iterrows():
-        ref_lat, ref_long = row['REF POINT LAT'], row['REF POINT LONG']
 
+def get_dip_layout(columns: List[str], helis: List[str]) -> List[Tuple[str, str, float, float]]:
+    """
+    Returns the lat and long column, bearing and distance of every dip in the columns
+    """
+    table = dip_tables[str(len(helis))]
+    layout = list()
+
+    # For every heli do:
+    for index, heli in enumerate(helis):
+        dip_lat, dip_long = heli, re.sub(r'\bX\b', 'Y', heli)
         current_dip = 1
 
-        # For every heli do:
-        for index, heli in enumerate(helis):
-            dip_lat, dip_long = heli, re.sub(r'\bX\b', 'Y', heli)
-            dip_degrees_scheme = degrees_scheme[index]
+        # For every dip do:
+        while dip_lat in columns:
+            bearing, km = table[index][current_dip - 1]
+            layout.append((dip_lat, dip_long, bearing, km))
 
-            # For every dip do:
-            while dip_lat in list(df_to_convert.columns):
-                dip_scheme = scheme[current_dip - 1]
-                degrees, nm = dip_scheme[0], dip_scheme[1]
-                degrees = (degrees + dip_degrees_scheme) % 360
+            dip_lat = dip_lat.replace(str(current_dip), str(current_dip + 1))
+            dip_long = dip_long.replace(str(current_dip), str(current_dip + 1))
 
-                new_lat, new_long = move_geo_point(ref_lat, ref_long, degrees, nm)
+            current_dip = current_dip + 1
 
-                df_to_convert.at[i, dip_lat] = new_lat
-                df_to_convert.at[i, dip_long] = new_long
+    return layout
 
-                dip_lat = dip_lat.replace(str(current_dip), str(current_dip + 1))
-                dip_long = dip_long.replace(str(current_dip), str(current_dip + 1))
 
-                current_dip = current_dip + 1
+def convert_sonar_plan_44(df: DataFrame, scientific_cols):
+    df_to_convert: DataFrame = df.copy()
+
+    helis = get_dip_cols(scientific_cols)
+    layout = get_dip_layout(list(df_to_convert.columns), helis)
 
-            # go to next dip
-            current_dip = 1
+    if len(layout) == 0 or len(df_to_convert) == 0:
+        return df_to_convert
+
+    ref_lat = df_to_convert['REF POINT LAT'].to_numpy(dtype=float)
+    ref_long = df_to_convert['REF POINT LONG'].to_numpy(dtype=float)
+
+    if not np.all(np.isfinite(ref_lat) & np.isfinite(ref_long)) or np.any(np.abs(ref_lat) > 90):
+        raise ValueError('Reference points must be finite and latitudes must be in the [-90; 90] range')
+
+    bearings = np.array([bearing for _, _, bearing, _ in layout])
+    distances = np.array([km for _, _, _, km in layout])
+
+    # move every reference point to every dip at once, a row for every reference point and a column for every dip
+    new_lat, new_long = move_geo_points(ref_lat[:, None], ref_long[:, None], bearings[None, :], distances[None, :])
+
+    for i, (dip_lat, dip_long, _, _) in enumerate(layout):
+        df_to_convert[dip_lat] = new_lat[:, i]
+        df_to_convert[dip_long] = new_long[:, i]
 
     return df_to_convert
 
@@ -119,15 +149,3 @@ def get_dip_points(cols):
     regex_positive = re.compile(r'\bX')
 
     return list(filter(regex_positive.search, cols))
-
-
-def move_geo_point(lat1, lon2, b, nm):
-    # given: lat1, lon1, b = bearing in degrees, nm = distance in nautical miles
-    # calculates the next geo point in latitude and longitude
-
-    km = convert_dist(nm, 'nm', 'km')
-    origin = geopy.Point(lat1, lon2)
-    destination = geodesic(kilometers=km).destination(origin, b)
-
-    lat2, lon2 = destination.latitude, destination.longitude
-    return lat2, lon2
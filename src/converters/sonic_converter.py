@@ -1,4 +1,6 @@
-from pandas import DataFrame
+from typing import Tuple, List
+
+from pandas import DataFrame, Series
 
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
@@ -24,34 +26,19 @@ class SonicConverter(IConverter):
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        # the sonic columns are added to the ping events
+        return ['TIME_', 'EVENT TYPE', 'PING ON/OFF STAT'] if name == 'SONIC' else []
+
 
 def convert_sonic_cols(df: DataFrame, tact_scenario: DataFrame):
     sonic_df: DataFrame = df.copy()
-    sonic_df[['START TIME (Z)', 'END TIME (Z)']] = np.nan
-    i = 1
-    pinging = False
-    for index, row in sonic_df.iterrows():
-        if row['EVENT TYPE'] == 'SONIC_PINGING' and row['PING ON/OFF STAT'] == 'ON' and not pinging:
-            # Remember the first (ping = ON)
-            i = index
-            pinging = True
-            sonic_df.loc[index, 'START TIME (Z)'] = row['TIME_']
-        elif row['EVENT TYPE'] == 'SONIC_PINGING' and row['PING ON/OFF STAT'] == 'OFF' and pinging:
-            # if we find a ping OFF set the end time of the remembered ping ON to the time of this row
-            sonic_df.loc[i, 'END TIME (Z)'] = row['TIME_']
-            sonic_df.loc[index, 'END TIME (Z)'] = np.nan
-            pinging = False
-
-    sonic_df['START TIME (Z)'] = pd.to_timedelta(sonic_df['START TIME (Z)'].astype(str), errors='coerce')
-    sonic_df['END TIME (Z)'] = pd.to_timedelta(sonic_df['END TIME (Z)'].astype(str), errors='coerce')
+
+    # start and end are timestamps, only the time of day is shown in the view and export
+    sonic_df['START TIME (Z)'], sonic_df['END TIME (Z)'] = get_ping_sessions(sonic_df)
     sonic_df['DURATION'] = (sonic_df['END TIME (Z)'] - sonic_df['START TIME (Z)'])
 
-    sonic_df['DURATION'] = sonic_df['DURATION'].astype(str).apply(lambda x: x[7:])\
-        .where(pd.notnull(sonic_df['DURATION']))
-    sonic_df['START TIME (Z)'] = sonic_df['START TIME (Z)'].astype(str).apply(lambda x: x[7:])\
-        .where(pd.notnull(sonic_df['START TIME (Z)']))
-    sonic_df['END TIME (Z)'] = sonic_df['END TIME (Z)'].astype(str).apply(lambda x: x[7:])\
-        .where(pd.notnull(sonic_df['END TIME (Z)']))
+    sonic_df['DURATION'] = sonic_df['DURATION'].astype(str).str[7:].where(pd.notnull(sonic_df['DURATION']))
 
     sonic_df['LATITUDE'] = tact_scenario['GRID CENTER LAT'].iloc[0]
     sonic_df['LONGITUDE'] = tact_scenario['GRID CENTER LONG'].iloc[0]
@@ -61,3 +48,32 @@ def convert_sonic_cols(df: DataFrame, tact_scenario: DataFrame):
     sonic_df['FREQUENCY'] = '<4kHz'
 
     return sonic_df
+
+
+def get_ping_sessions(df: DataFrame) -> Tuple[Series, Series]:
+    """
+    Pair the pinging events to sessions. A session starts at the first ping ON and ends at the first ping OFF after it.
+    Returns the start and end time of every session at the row where the session starts
+    """
+    pinging: np.ndarray = (df['EVENT TYPE'] == 'SONIC_PINGING').to_numpy()
+    ping_on: np.ndarray = pinging & (df['PING ON/OFF STAT'] == 'ON').to_numpy()
+    ping_off: np.ndarray = pinging & (df['PING ON/OFF STAT'] == 'OFF').to_numpy()
+
+    # after any ON event the sonar is pinging and after any OFF event it is not,
+    # so an event only starts or ends a session when the previous ON/OFF event differs from it
+    events: np.ndarray = np.flatnonzero(ping_on | ping_off)
+    is_on: np.ndarray = ping_on[events]
+    was_on: np.ndarray = np.concatenate([[False], is_on[:-1]])
+
+    starts: np.ndarray = events[is_on & ~was_on]
+    ends: np.ndarray = events[~is_on & was_on]
+
+    times: np.ndarray = pd.to_datetime(df['TIME_']).to_numpy()
+    start_times: np.ndarray = np.full(len(df), np.datetime64('NaT'), dtype=times.dtype)
+    end_times: np.ndarray = np.full(len(df), np.datetime64('NaT'), dtype=times.dtype)
+
+    # sessions start and end alternately, only the last session may not have ended
+    start_times[starts] = times[starts]
+    end_times[starts[:len(ends)]] = times[ends]
+
+    return pd.Series(start_times, index=df.index), pd.Series(end_times, index=df.index)
@@ -1,8 +1,10 @@
-from typing import List
+from typing import List, Dict
 import re
+
+import numpy as np
 from pandas import DataFrame
-import math
 
+from src.converters.utility import DURATION, format_durations
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
 import pandas as pd
@@ -13,57 +15,87 @@ from src.log import get_logger
 class TimeConverter(IConverter):
     logger = get_logger(__name__)
 
-    def __init__(self):
+    def __init__(self, native_durations: bool = False):
         super().__init__()
+        # sonobuoy durations are kept as timedelta64 and only formatted when shown or exported
+        self.native_durations: bool = native_durations
 
     def convert(self, df: DataFrame, **kwargs) -> DataFrame:
         try:
             if kwargs['name'] == 'SONOBUOY':
-                return convert_sbuoy_time_cols(df)
+                return convert_sbuoy_time_cols(df, self.native_durations)
             else:
                 return convert_time_cols(df, kwargs['scientific_cols'])
         except Exception as e:
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        if name == 'SONOBUOY':
+            return sbuoy_time_cols if all(col in columns for col in sbuoy_time_cols) else []
+        else:
+            return get_time_cols(scientific_cols)
+
+    def get_formats(self, name: str, columns: List[str], scientific_cols: List[str]) -> Dict[str, str]:
+        if name == 'SONOBUOY' and self.native_durations:
+            return dict.fromkeys(sbuoy_time_cols, DURATION)
+
+        return dict()
+
+
+sbuoy_time_cols: List[str] = ['LIFE TIME', 'REMAINING TIME']
+
 
 def convert_time_cols(df: DataFrame, scientific_cols: List[str]):
     df_to_timestamp: DataFrame = df.copy()
 
-    regex_time = re.compile(r'(?=.*TIME)^((?!EVENT HEADER).)*$')
-    timestamp_cols = list(filter(regex_time.search, scientific_cols))
+    timestamp_cols = get_time_cols(scientific_cols)
 
     if len(timestamp_cols) > 0:
         df_to_timestamp[timestamp_cols] = df_to_timestamp[timestamp_cols].apply(pd.to_datetime, unit='s', errors='coerce')
 
+        # timestamps stay native, only the time of day is shown in the view and export
         df_to_timestamp[timestamp_cols] = df_to_timestamp[timestamp_cols].apply(
             lambda x: x.dt.round('1s') if pd.notnull(x).any() else x)
-        df_to_timestamp[timestamp_cols] = df_to_timestamp[timestamp_cols].apply(
-            lambda x: x.dt.time if pd.notnull(x).any() else x)
 
     return df_to_timestamp
 
 
-def convert_sbuoy_time_cols(df: DataFrame):
-    df_to_duration: DataFrame = df.copy()
+def get_time_cols(scientific_cols: List[str]) -> List[str]:
+    regex_time = re.compile(r'(?=.*TIME)^((?!EVENT HEADER).)*$')
 
-    df_to_duration['LIFE TIME'] = df_to_duration['LIFE TIME'].apply(
-        lambda x: pd.Timedelta(convert_time_string(float(x)), format='%Y-%m-%d') if pd.notnull(x) else x)
+    return list(filter(regex_time.search, scientific_cols))
 
-    df_to_duration['REMAINING TIME'] = df_to_duration['REMAINING TIME'].apply(
-        lambda x: pd.Timedelta(convert_time_string(float(x) / 1000), format='%Y-%m-%d') if pd.notnull(x) else x)
 
-    df_to_duration['LIFE TIME'] = df_to_duration['LIFE TIME'].astype(str).map(lambda x: x[7:])
-    df_to_duration['REMAINING TIME'] = df_to_duration['REMAINING TIME'].astype(str).map(lambda x: x[7:])
+def convert_sbuoy_time_cols(df: DataFrame, native: bool = False):
+    """
+    Converts the LIFE TIME (seconds) and REMAINING TIME (milliseconds) of sonobuoys to durations in whole seconds.
+    The durations are formatted to text, unless they are kept native
+    """
+    df_to_duration: DataFrame = df.copy()
+
+    for col, seconds in [('LIFE TIME', df['LIFE TIME'].to_numpy(dtype=float)),
+                         ('REMAINING TIME', df['REMAINING TIME'].to_numpy(dtype=float) / 1000)]:
+        durations: np.ndarray = get_durations(seconds)
+
+        df_to_duration[col] = durations if native else format_durations(durations)
 
     return df_to_duration
 
 
-def convert_time_string(dec):
-    hours = dec / 3600
-    minutes, hour = math.modf(hours)
-    minutes = minutes * 60
-    seconds, minute = math.modf(minutes)
-    seconds = seconds * 60
+def get_durations(seconds: np.ndarray) -> np.ndarray:
+    """
+    Rounds seconds to whole hours, minutes and seconds and returns them as timedelta64.
+    Like a duration written as hours:minutes:seconds, only the hours can be negative
+    """
+    with np.errstate(invalid='ignore'):
+        minutes, hours = np.modf(seconds / 3600)
+        seconds, minutes = np.modf(minutes * 60)
+        # rint rounds half to even, like round
+        hours, minutes, seconds = np.rint(hours), np.rint(minutes), np.rint(seconds * 60)
+
+    if np.any((minutes < 0) | (seconds < 0)):
+        raise ValueError('only leading negative signs are allowed')
 
-    return str(round(hour)) + ':' + str(round(minute)) + ':' + str(round(seconds))
+    with np.errstate(invalid='ignore'):
+        return pd.to_timedelta(hours * 3600 + minutes * 60 + seconds, unit='s').to_numpy()
@@ -1,16 +1,89 @@
-import math
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple, Union
 
 import re
 
 from pandas import DataFrame
 import pandas as pd
 
+from src.converters.geodesy import create_grid_centers, convert_yards_to_positions, convert_yards_to_degrees
+from src.dataclasses.grid_centers import GridCenters
 from src.exceptions import ConversionFailedException
 from src.log import get_logger
 from src.utility import get_exception
 import numpy as np
 
+logger = get_logger(__name__)
+
+
+# --- DISPLAY FORMATS ---
+# converted columns keep their numeric values and are tagged with a display format,
+# the values are only formatted to text when they are shown or exported
+DEGREES: str = 'degrees'
+LATITUDE: str = 'latitude'
+LONGITUDE: str = 'longitude'
+DURATION: str = 'duration'
+
+
+def format_values(display_format: str, values) -> np.ndarray:
+    """
+    Formats numeric values to text according to their display format, values which can not be formatted become NaN
+    """
+    if display_format == DURATION:
+        return format_durations(values)
+
+    values = np.asarray(values, dtype=float)
+
+    if display_format == DEGREES:
+        return format_bearings(values)
+    elif display_format == LATITUDE:
+        return format_degrees_to_coordinates(values, 'N', 'S', 2)[0]
+    elif display_format == LONGITUDE:
+        return format_degrees_to_coordinates(values, 'E', 'W', 3)[0]
+
+    raise ValueError('Unknown display format {0}'.format(display_format))
+
+
+def format_bearings(values: np.ndarray) -> np.ndarray:
+    """
+    Formats whole degrees to consist of 3 numbers, like convert_degrees
+    """
+    text: np.ndarray = np.full(len(values), np.nan, dtype=object)
+    valid: np.ndarray = np.isfinite(values)
+
+    text[valid] = format_integers(np.abs(values[valid]), 3)
+
+    return text
+
+
+def format_durations(values) -> np.ndarray:
+    """
+    Formats durations like str(pd.Timedelta)[7:], which drops the days of durations below 10 days.
+    Missing durations become empty
+    """
+    durations: np.ndarray = np.asarray(pd.to_timedelta(values), dtype='timedelta64[ns]')
+
+    text: np.ndarray = np.full(len(durations), '', dtype=object)
+    valid: np.ndarray = ~np.isnat(durations)
+
+    seconds, fraction = np.divmod(durations[valid].astype(np.int64), 1000000000)
+    days, seconds = np.divmod(seconds, 86400)
+    hours, seconds = np.divmod(seconds, 3600)
+    minutes, seconds = np.divmod(seconds, 60)
+
+    # the days and their separator are exactly sliced off when the days are written in a single digit,
+    # other durations keep part of it
+    sliced: np.ndarray = (days >= 0) & (days < 10) & (fraction == 0)
+
+    valid_text: np.ndarray = np.empty(len(days), dtype=object)
+    valid_text[sliced] = format_integers(hours[sliced], 2) + ':' + format_integers(minutes[sliced], 2) + ':' + \
+        format_integers(seconds[sliced], 2)
+    valid_text[~sliced] = [str(duration)[7:] for duration in pd.to_timedelta(durations[valid][~sliced])]
+
+    text[valid] = valid_text
+
+    return text
+
 
 # --- STRING FORMATTERS ---
 def format_degrees_to_coordinate_lat(dd: float) -> str:
@@ -61,27 +134,98 @@ def format_seconds(seconds: float):
     return str("%02.i" % round(seconds))
 
 
+def validate_positions(lat: np.ndarray, long: np.ndarray) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Returns the lat and long degrees of the positions which can be formatted to coordinates, other positions become NaN.
+    The number of these positions is returned as well
+    """
+    with np.errstate(over='ignore', invalid='ignore'):
+        invalid: np.ndarray = ~(np.isfinite(np.abs(lat) * 3600) & np.isfinite(np.abs(long) * 3600))
+
+    return np.where(invalid, np.nan, lat), np.where(invalid, np.nan, long), int(np.count_nonzero(invalid))
+
+
+def format_degrees_to_coordinates(dd: np.ndarray, positive: str, negative: str,
+                                  width: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Vectorized format_degrees_to_coordinate_lat/long, with the same rounding.
+    Returns the coordinates and whether a value could be formatted
+    """
+    dd = np.asarray(dd, dtype=float)
+
+    with np.errstate(invalid='ignore', over='ignore'):
+        minutes, seconds = np.divmod(np.abs(dd) * 3600, 60)
+        degrees, minutes = np.divmod(minutes, 60)
+
+    coordinates: np.ndarray = np.full(len(dd), np.nan, dtype=object)
+    valid: np.ndarray = np.isfinite(seconds) & np.isfinite(degrees)
+
+    if np.any(valid):
+        # rint rounds half to even, like round
+        degrees, minutes, seconds = [np.rint(value[valid]) for value in (degrees, minutes, seconds)]
+        hemisphere: np.ndarray = np.where(dd[valid] < 0, negative, positive).astype(object)
+
+        coordinates[valid] = hemisphere + ' ' + format_integers(degrees, width) + '° ' + \
+            format_integers(minutes, 2) + "' " + format_integers(seconds, 2) + '"'
+
+    return coordinates, valid
+
+
+def format_integers(values: np.ndarray, width: int) -> np.ndarray:
+    """
+    Formats whole numbers like %0{width}d. Numbers below 1000 are looked up in a table of formatted numbers
+    """
+    table: np.ndarray = get_integer_table(width)
+
+    text: np.ndarray = np.empty(len(values), dtype=object)
+    small: np.ndarray = values < len(table)
+
+    text[small] = table[values[small].astype(np.int64)]
+    text[~small] = ['%0*d' % (width, round(value)) for value in values[~small]]
+
+    return text
+
+
+@lru_cache()
+def get_integer_table(width: int) -> np.ndarray:
+    return np.array(['%0*d' % (width, i) for i in range(1000)], dtype=object)
+
+
 # --- YARDS TO DEGREES CONVERSION ---
-def convert_x_y_cols(df: DataFrame, tact_scenario: DataFrame, scientific_cols: List[str]) -> DataFrame:
+def convert_x_y_cols(df: DataFrame, tact_scenario: DataFrame, scientific_cols: List[str],
+                     grid_centers: Union[GridCenters, None] = None) -> DataFrame:
     df_to_convert: DataFrame = df.copy()
     # get all position cols
     x_cols = get_x_cols(scientific_cols)
 
+    if len(x_cols) == 0:
+        return df_to_convert
+
+    # the grid centers are computed once per convert, when they are not given they are computed here
+    if grid_centers is None:
+        grid_centers = create_grid_centers(tact_scenario)
+
+    # the grid center of the tactical scenario of every row
+    row_grid_centers: GridCenters = grid_centers.take(df_to_convert['REFERENCE'])
+
     for x_col in x_cols:
         x_pos: str = x_col
-        y_pos = re.sub(r'\bX\b', 'Y', x_pos)
+        y_pos = get_y_col(x_pos)
 
         if bool(x_pos) and bool(y_pos):
             # for every X and Y col, convert yards to coordinate
-            df_to_convert[[x_pos, y_pos]] = df_to_convert[[x_pos, y_pos, 'REFERENCE']].apply(
-                lambda row, x=x_pos, y=y_pos:
-                convert_yards_to_coordinates(
-                    row[x],
-                    row[y],
-                    tact_scenario[tact_scenario['REFERENCE'] == row['REFERENCE']]['GRID CENTER LAT'].iloc[0],
-                    tact_scenario[tact_scenario['REFERENCE'] == row['REFERENCE']]['GRID CENTER LONG'].iloc[0])
-                # convert_yards_to_coordinates returns a tuple, therefore apply pd.series
-                if pd.notnull(row).any() else row, axis=1).apply(pd.Series)
+            lat, long = convert_yards_to_positions(
+                pd.to_numeric(df_to_convert[x_pos], errors='coerce').to_numpy(dtype=float),
+                pd.to_numeric(df_to_convert[y_pos], errors='coerce').to_numpy(dtype=float),
+                row_grid_centers)
+
+            lat, long, invalid = validate_positions(lat, long)
+            if invalid > 0:
+                logger.error('{0} positions of {1}, {2} could not be converted'.format(invalid, x_pos, y_pos))
+
+            # the columns keep the degrees, they are shown as coordinates
+            df_to_convert[x_pos] = lat
+            df_to_convert[y_pos] = long
 
     return df_to_convert
 
@@ -96,6 +240,10 @@ def get_x_cols(scientific_columns) -> List:
     return x_cols
 
 
+def get_y_col(x_col: str) -> str:
+    return re.sub(r'\bX\b', 'Y', x_col)
+
+
 def convert_yards_to_coordinates(lat_yards, long_yards, tact_lat_deg, tact_long_deg):
     try:
         lat, long = convert_yards_to_degrees(lat_yards, long_yards, tact_lat_deg, tact_long_deg)
@@ -105,53 +253,6 @@ def convert_yards_to_coordinates(lat_yards, long_yards, tact_lat_deg, tact_long_
         return np.nan, np.nan
 
 
-def pos_neg(num):
-    if num >= 0:
-        return 0 if num == 0 else 1
-    else:
-        return -1
-
-
-def convert_yards_to_degrees(lat_yards, long_yards, tact_lat_deg, tact_long_deg):
-    # if data is missing, break function otherwise dividing by zero errors will occur
-    if lat_yards == 0 or long_yards == 0:
-        return lat_yards, long_yards
-
-    # degrees to radius
-    tact_lat_rad = tact_lat_deg * math.pi / 180
-
-    # yards to meters
-    x_heli_meters, y_heli_meters = lat_yards / 1.09361, long_yards / 1.09361
-
-    # Position (x and y) of the OwnHelo compared to the Tactical Scenario
-    x, y = x_heli_meters, y_heli_meters
-
-    # intersection
-    x_y = x / y
-
-    # major semi-axis WGS-84
-    a = 6378137.000
-    # squared major eccentricity WGS-84
-    e = 0.08181919084262
-
-    alpha = math.atan(x_y)
-    # Earth radius
-    rho = a * math.sqrt(1 - ((e * e) * math.sin(tact_lat_rad) * math.sin(tact_lat_rad)))
-    beta = pos_neg(y) * math.atan(math.sqrt(x * x + y * y) / rho)
-
-    # Latitude of the OwnHelo degrees
-    lat_deg = (180 / math.pi) * math.asin((math.sin(tact_lat_rad)
-                                           * math.cos(beta)) + (math.cos(tact_lat_rad)
-                                                                * math.sin(beta) * math.cos(alpha)))
-    # Latitude of the OwnHelo yards
-    lat_rad = lat_deg * math.pi / 180
-
-    # Longitude of the OwnHelo
-    long_deg = tact_long_deg + (180 / math.pi) * math.asin(math.sin(alpha) * math.sin(beta) / math.cos(lat_rad))
-
-    return lat_deg, long_deg
-
-
 def convert_degrees_to_coordinates(lat: float, long: float):
     try:
         return format_degrees_to_coordinate_lat(float(lat)), format_degrees_to_coordinate_long(float(long))
@@ -161,6 +262,23 @@ def convert_degrees_to_coordinates(lat: float, long: float):
         return np.nan, np.nan
 
 
+def round_values(values: np.ndarray, decimals: int) -> np.ndarray:
+    """
+    Rounds an array like round(value, decimals). np.round scales the values first, so values close to a half can be
+    rounded differently, these few values are rounded with round itself
+    """
+    rounded: np.ndarray = np.round(values, decimals)
+
+    with np.errstate(invalid='ignore'):
+        scaled: np.ndarray = values * 10 ** decimals
+        close: np.ndarray = (np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5) < 1e-6) | (np.abs(scaled) >= 2 ** 52)
+
+    if np.any(close):
+        rounded[close] = [round(value, decimals) for value in values[close]]
+
+    return rounded
+
+
 def convert_dist(length, unit_in, unit_out):
     # supported units metric: mm, cm, m, km
     # supported units imperial: in, feet, yard, mi, nm, ly
@@ -1,6 +1,8 @@
+from typing import List, Dict
+
 from pandas import DataFrame
 
-from src.converters.utility import convert_x_y_cols
+from src.converters.utility import convert_x_y_cols, get_x_cols, get_y_col, LATITUDE, LONGITUDE
 from src.interfaces.converter_interface import IConverter
 from src.utility import get_exception
 
@@ -15,7 +17,20 @@ class YardsToCoordinatesConverter(IConverter):
 
     def convert(self, df: DataFrame, **kwargs) -> DataFrame:
         try:
-            return convert_x_y_cols(df, kwargs['tact_scenario'], kwargs['scientific_cols'])
+            return convert_x_y_cols(df, kwargs['tact_scenario'], kwargs['scientific_cols'], kwargs.get('grid_centers'))
         except Exception as e:
             self.logger.error(get_exception(e))
             return df
+
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        x_cols = get_x_cols(scientific_cols)
+
+        if len(x_cols) == 0:
+            return []
+
+        # the grid center of a row is found by its reference
+        return [col for x_col in x_cols for col in (x_col, get_y_col(x_col))] + ['REFERENCE']
+
+    def get_formats(self, name: str, columns: List[str], scientific_cols: List[str]) -> Dict[str, str]:
+        return {col: display_format for x_col in get_x_cols(scientific_cols)
+                for col, display_format in ((x_col, LATITUDE), (get_y_col(x_col), LONGITUDE))}
@@ -1,12 +1,15 @@
+from typing import List
+
 from pandas import DataFrame
 import re
 
-from src.converters.utility import convert_dist
+from src.converters.utility import convert_dist, round_values
 from src.interfaces.converter_interface import IConverter
 from src.log import get_logger
 from src.utility import get_exception
 
 import numpy as np
+import pandas as pd
 
 
 class YardsToNMConverter(IConverter):
@@ -22,6 +25,9 @@ class YardsToNMConverter(IConverter):
             self.logger.error(get_exception(e) + ' ' + kwargs['name'])
             return df
 
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        return get_yard_cols(scientific_cols)
+
 
 def convert_yards_to_nm(df, scientific_cols):
     df_to_convert = df.copy()
@@ -29,7 +35,17 @@ def convert_yards_to_nm(df, scientific_cols):
     cols = get_yard_cols(scientific_cols)
 
     for col in cols:
-        df_to_convert[col] = df_to_convert[col].apply(yards_to_nm)
+        yards: np.ndarray = pd.to_numeric(df_to_convert[col], errors='coerce').to_numpy(dtype=float)
+
+        with np.errstate(invalid='ignore', over='ignore'):
+            nm: np.ndarray = round_values(convert_dist(yards, 'yd', 'nm'), 3)
+
+        # missing values stay missing, other values which can not be converted are counted
+        invalid: int = int(np.count_nonzero(np.isnan(nm) & df_to_convert[col].notna().to_numpy()))
+        if invalid > 0:
+            YardsToNMConverter.logger.error('{0} values of {1} could not be converted'.format(invalid, col))
+
+        df_to_convert[col] = pd.Series(nm, index=df_to_convert.index)
 
     return df_to_convert
 
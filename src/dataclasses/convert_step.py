@@ -0,0 +1,14 @@
+from dataclasses import dataclass, field
+from typing import List, Dict
+
+
+@dataclass
+class ConvertStep:
+    identifier: str
+    converter: str
+    columns: List[str] = field(default_factory=list)
+    formats: Dict[str, str] = field(default_factory=dict)
+
+    def __str__(self) -> str:
+        return '{0}: {1} [{2}]'.format(self.identifier, self.converter, ', '.join(
+            col + ' as ' + self.formats[col] if col in self.formats else col for col in self.columns))
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from typing import Union
+
+
+@dataclass
+class FilterRange:
+    # the bounds as typed, a missing bound is open
+    lower: Union[str, None] = None
+    upper: Union[str, None] = None
+    include_lower: bool = True
+    include_upper: bool = True
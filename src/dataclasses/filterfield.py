@@ -11,6 +11,8 @@ class Field(QObject):
         self.name: str = name
 
         self.filter_field: QLineEdit = QLineEdit('')
+        self.filter_field.setToolTip('Text or regular expression, numbers and times: >value, <value, =value or '
+                                     'lower..upper')
         self.filter_field.textChanged.connect(lambda x: parent.set_filter(self))
 
         self.column_field: QListWidgetItem = QListWidgetItem(name)
@@ -0,0 +1,40 @@
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class GridCenters:
+    """
+    The grid center of the tactical scenario of every reference, with the constants needed to convert positions
+    relative to it. These are computed once per reference instead of for every row
+    """
+    references: pd.Index
+    lat_deg: np.ndarray
+    long_deg: np.ndarray
+    sin_lat: np.ndarray
+    cos_lat: np.ndarray
+    # radius of curvature (meters) at the latitude of the grid center
+    rho: np.ndarray
+
+    def get_positions(self, references) -> np.ndarray:
+        """
+        Returns the position of the grid center of every reference, raises an IndexError for unknown references
+        """
+        positions: np.ndarray = self.references.get_indexer(references)
+
+        if np.any(positions < 0):
+            raise IndexError('No tactical scenario for reference(s) {0}'.format(
+                ', '.join(map(str, pd.unique(np.asarray(references)[positions < 0])))))
+
+        return positions
+
+    def take(self, references) -> 'GridCenters':
+        """
+        Returns the grid center of every reference
+        """
+        positions: np.ndarray = self.get_positions(references)
+
+        return GridCenters(pd.Index(references), self.lat_deg[positions], self.long_deg[positions],
+                           self.sin_lat[positions], self.cos_lat[positions], self.rho[positions])
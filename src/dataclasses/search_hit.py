@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class SearchHit:
+    identifier: str
+    # position of the row in the unfiltered DataFrame of the identifier
+    row: int
+    column: str
+    # the text shown for the cell
+    text: str = str()
+
+    def __str__(self) -> str:
+        return '{0} row {1} {2}: {3}'.format(self.identifier, self.row + 1, self.column, self.text)
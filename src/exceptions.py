@@ -16,3 +16,7 @@ class IdentifierNotFoundException(Exception):
 
 class ColumnNotFoundException(Exception):
     pass
+
+
+class FilterCancelledException(Exception):
+    pass
@@ -3,6 +3,7 @@ import pandas as pd
 
 from src.log import get_logger
 from src.models.dataframe_model import DataFrameModel
+from src.models.utility import format_frame
 from src.types import MerData
 
 
@@ -21,6 +22,6 @@ def export(mer_data: MerData, dst: str) -> None:
 
     df: DataFrameModel
     for name, dfm in mer_data.items():
-        dfm.df.to_excel(writer, name, index=False)
+        format_frame(dfm.df, dfm.formats).to_excel(writer, name, index=False)
 
     writer.save()
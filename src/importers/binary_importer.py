@@ -1,9 +1,10 @@
-from pandas import DataFrame
-
 from src.interfaces.importer_interface import IImporter
+from src.types import ImportData
 
 
 class BinaryImporter(IImporter):
     # this is only a placeholder for a future BinaryImporter
-    def import_(self, path: str, **kwargs) -> DataFrame:
+    version: str = '1'
+
+    def import_(self, path: str, **kwargs) -> ImportData:
         raise NotImplementedError
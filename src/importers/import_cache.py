@@ -0,0 +1,143 @@
+import hashlib
+import os
+import tempfile
+from typing import Union, List
+
+import pandas as pd
+
+from src.importers.utility import open_file
+from src.interfaces.importer_interface import IImporter
+from src.log import get_logger
+from src.types import ImportData
+from src.utility import get_exception
+
+# environment variable which overrides the directory of the import cache, e.g. for tests
+CACHE_PATH_VARIABLE: str = 'MER_IO_CACHE'
+
+
+class ImportCache:
+    """
+    Keeps the result of an import on disk, keyed by the content of the imported file and the importer version.
+    When the cache exceeds its maximum size, the least recently used entries are removed.
+    """
+    logger = get_logger(__name__)
+    extension: str = '.pkl'
+
+    def __init__(self, path: Union[str, None] = None, max_size: int = 512 * 1024 * 1024):
+        self.path: str = path if path is not None else get_cache_path()
+        self.max_size: int = max_size
+
+    def load(self, importer: IImporter, path: str) -> Union[ImportData, None]:
+        """
+        Returns the cached import of a file, or None when the file is not cached
+        """
+        try:
+            entry: str = self.get_entry(importer, path)
+            if not os.path.isfile(entry):
+                return None
+
+            data: ImportData = pd.read_pickle(entry)
+
+            # mark entry as recently used
+            os.utime(entry)
+            return data
+        except Exception as e:
+            self.logger.error(get_exception(e))
+            return None
+
+    def store(self, importer: IImporter, path: str, data: ImportData) -> None:
+        try:
+            os.makedirs(self.path, exist_ok=True)
+            entry: str = self.get_entry(importer, path)
+
+            # write to a unique temporary file first, so an interrupted write never leaves a corrupt entry
+            # and workers storing the same file at once do not write to the same temporary file
+            fd, temp = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    pd.to_pickle(data, f)
+                os.replace(temp, entry)
+            except Exception:
+                os.unlink(temp)
+                raise
+
+            self.evict()
+        except Exception as e:
+            self.logger.error(get_exception(e))
+
+    def evict(self) -> None:
+        """
+        Remove the least recently used entries until the cache fits its maximum size
+        """
+        entries: List[os.DirEntry] = sorted(self.get_entries(), key=lambda x: x.stat().st_mtime)
+        size: int = sum(entry.stat().st_size for entry in entries)
+
+        for entry in entries:
+            if size <= self.max_size:
+                break
+
+            size -= entry.stat().st_size
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                # already removed by another import
+                pass
+
+    def invalidate(self, importer: Union[IImporter, None] = None) -> None:
+        """
+        Remove all entries of older versions of an importer, or all entries when no importer is given
+        """
+        try:
+            for entry in self.get_entries():
+                if importer is None:
+                    os.unlink(entry.path)
+                elif entry.name.startswith(get_importer_name(importer) + '-') \
+                        and not entry.name.startswith(get_importer_key(importer) + '-'):
+                    os.unlink(entry.path)
+        except Exception as e:
+            self.logger.error(get_exception(e))
+
+    def get_entries(self) -> List[os.DirEntry]:
+        if not os.path.isdir(self.path):
+            return []
+
+        return [entry for entry in os.scandir(self.path) if entry.name.endswith(self.extension)]
+
+    def get_entry(self, importer: IImporter, path: str) -> str:
+        return os.path.join(self.path, '{0}-{1}{2}'.format(get_importer_key(importer), hash_file(path), self.extension))
+
+
+def get_cache_path() -> str:
+    """
+    Returns the directory of the import cache, a per user cache directory (LOCALAPPDATA on Windows,
+    XDG_CACHE_HOME or ~/.cache elsewhere) unless it is set by the MER_IO_CACHE environment variable
+    """
+    path: Union[str, None] = os.environ.get(CACHE_PATH_VARIABLE)
+    if path:
+        return path
+
+    base: str = os.environ.get('LOCALAPPDATA') or os.environ.get('XDG_CACHE_HOME') \
+        or os.path.join(os.path.expanduser('~'), '.cache')
+
+    return os.path.join(base, 'mer.io', 'cache')
+
+
+def get_importer_name(importer: IImporter) -> str:
+    return type(importer).__name__
+
+
+def get_importer_key(importer: IImporter) -> str:
+    return '{0}-{1}'.format(get_importer_name(importer), importer.version)
+
+
+def hash_file(path: str, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Returns a hash of the file contents
+    """
+    file_hash = hashlib.blake2b(digest_size=20)
+
+    with open_file(path) as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            file_hash.update(chunk)
+
+    return file_hash.hexdigest()
@@ -1,57 +1,70 @@
-from typing import Union
+import io
+from typing import Dict, Iterable, Generator
 
+from src.importers.utility import assemble_events, Token, open_file
 from src.interfaces.importer_interface import IImporter
+from src.types import ImportData
 
 import pandas as pd
-from pandas import DataFrame
+import numpy as np
+from pandas import DataFrame, Series
 
 
 class TextImporter(IImporter):
+    version: str = '4'
+
     def __init__(self):
         super(TextImporter, self).__init__()
 
-    def import_(self, path: str, **kwargs) -> Union[DataFrame, None]:
-        df: DataFrame = import_file(path)
+    def import_(self, path: str, **kwargs) -> ImportData:
+        with open_file(path) as f:
+            identifiers: ImportData = assemble_events(iter_tokens(io.TextIOWrapper(f, encoding='utf-8')))
+
+        for key, df in identifiers.items():
+            identifiers[key] = clean_scientific_columns(df)
+
+        if len(identifiers) > 0:
+            # the first identifier holds the first event, which is used to set the reference for the whole Mer
+            reference: str = get_reference(next(iter(identifiers.values())))
+
+            for key, df in identifiers.items():
+                df['REFERENCE'] = reference
+                identifiers[key] = clean_datetime_columns(df)
 
-        df = transpose_df(df)
-        df = clean_scientific_columns(df)
-        df = set_reference(df)
-        df = clean_datetime_columns(df)
+        return identifiers
 
-        return df
 
+# strings which read_csv would have parsed as missing values
+NA_VALUES = frozenset(['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+                       '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'n/a', 'nan', 'null'])
 
-def import_file(csv: str) -> DataFrame:
-    # import file from csv to DataFrame
-    df: DataFrame = pd.read_csv(csv, sep=':', names=['NAME', 'VALUE'], header=None, engine='python').apply(
-        lambda x: x.str.strip())
 
-    # remove all rows with --
-    df = df[df['NAME'] != '--']
-    # create an extra column to trace back al data to an event number
-    df['EVENT NUMBER'] = df[df['NAME'].str.contains('EVENT NUMBER')]['VALUE']
-    df['EVENT NUMBER'] = df['EVENT NUMBER'].fillna(method='ffill')
-    df['EVENT NUMBER'] = pd.to_numeric(df["EVENT NUMBER"])
+def iter_tokens(lines: Iterable[str]) -> Generator[Token, None, None]:
+    """
+    Yield a (name, value, event number) token for every line with data
+    """
+    event_number = np.nan
 
-    return df.set_index('NAME')
+    for line in lines:
+        if line.isspace() or not line:
+            # skip blank lines
+            continue
 
+        name, sep, value = line.rstrip('\r\n').partition(':')
 
-def transpose_df(df: DataFrame) -> DataFrame:
-    # group all events to an event number and create a separate DataFrame for every Event Number and its data
-    df_dict: dict[str, DataFrame] = dict(tuple(df.groupby(['EVENT NUMBER'])))
+        name = np.nan if name in NA_VALUES else name.strip()
+        if name == '--':
+            continue
 
-    # for every above Dataframe, drop the Event Number column and transpose (tilt) the DataFrame
-    for key, df in df_dict.items():
-        df_dict[key].drop('EVENT NUMBER', axis=1, inplace=True)
-        df_dict[key] = df_dict[key].T
-        # rename columns with the same name. this is necessary for concatenating later
-        df_dict[key] = rename_duplicate_columns(df_dict[key])
+        if not sep or value in NA_VALUES:
+            value = np.nan
+        else:
+            value = value.strip()
 
-    # concat all separate transposed DataFrames to one large DataFrame
-    all_data: DataFrame = pd.concat(list(df_dict.values()), sort=False, ignore_index=True) \
-        .dropna(axis=1, how='all')
+        if isinstance(name, str) and 'EVENT NUMBER' in name and isinstance(value, str):
+            event_number = value
 
-    return all_data
+        yield name, value, event_number
 
 
 def rename_duplicate_columns(df: DataFrame) -> DataFrame:
@@ -66,40 +79,80 @@ def rename_duplicate_columns(df: DataFrame) -> DataFrame:
 
 
 def clean_datetime_columns(df: DataFrame) -> DataFrame:
+    """
+    Replace the date/time columns of the event header by a DATE_ and a TIME_ (event timestamp) column
+    """
     df = df.copy()
-    df.insert(0, 'DATE_', (pd.to_datetime(
-        df['EVENT HEADER - TIME (YY)'].astype(str) + '-' + df['EVENT HEADER - TIME (MM)'].astype(str) + '-' +
-        df['EVENT HEADER - TIME (DD)'].astype(str), format='%y-%m-%d').dt.date))
+    timestamp: Series = get_timestamp(df)
 
-    df.insert(1, 'TIME_', (pd.to_datetime(
-        df['EVENT HEADER - TIME (HH)'].astype(str) + ':' + df['EVENT HEADER - TIME (MM).1'].astype(str) + ':' +
-        df['EVENT HEADER - TIME (SS)'].astype(str), format='%H:%M:%S').dt.time))
+    df.insert(0, 'DATE_', timestamp.dt.normalize())
+    df.insert(1, 'TIME_', timestamp)
 
     df = df.loc[:, ~df.columns.str.startswith('EVENT HEADER - TIME')]
 
     return df
 
 
+def get_timestamp(df: DataFrame) -> Series:
+    """
+    Returns the timestamp of every event, assembled from the date/time columns of the event header
+    """
+    components: DataFrame = df[['EVENT HEADER - TIME (YY)', 'EVENT HEADER - TIME (MM)', 'EVENT HEADER - TIME (DD)',
+                                'EVENT HEADER - TIME (HH)', 'EVENT HEADER - TIME (MM).1', 'EVENT HEADER - TIME (SS)']]\
+        .apply(pd.to_numeric)
+    components.columns = ['year', 'month', 'day', 'hour', 'minute', 'second']
+
+    # two digit years are 1969-2068, like strptime %y
+    components['year'] = components['year'] + np.where(components['year'] < 69, 2000, 1900)
+
+    return pd.to_datetime(components)
+
+
 def clean_scientific_columns(df: DataFrame) -> DataFrame:
     df = df.copy()
-    scientific_columns = list(df.columns[
-        df.stack().str.contains(r'^(?:-?\d*)\.?\d+[eE][-\+]?\d+$').any(level=1)])
-
-    numeric_columns = list(df.columns[
-        df.stack().str.match(r'[0-9]+').any(level=1)])
 
-    cols = list(set(scientific_columns + numeric_columns))
+    for col, values in infer_numeric_columns(df).items():
+        df[col] = values
 
-    df[cols] = df[cols].apply(pd.to_numeric, errors='coerce')
     return df
 
 
+def infer_numeric_columns(df: DataFrame, min_ratio: float = 0.5, sample_size: int = 10000) -> Dict[str, Series]:
+    """
+    Returns the numeric values of every text column in which at least min_ratio of the values are numbers.
+    Blank values are missing, they do not count and become NaN in a numeric column.
+    Columns longer than sample_size are judged on an evenly spread sample and only converted when numeric.
+    """
+    numeric_columns: Dict[str, Series] = dict()
+
+    for col in df.columns[df.dtypes == object]:
+        values: Series = df[col].dropna()
+
+        sampled: bool = len(values) > sample_size
+        if sampled:
+            values = values.iloc[np.linspace(0, len(values) - 1, sample_size).astype(int)]
+
+        values = values[values.astype(str).str.strip() != '']
+        if len(values) == 0:
+            continue
+
+        converted: Series = pd.to_numeric(values, errors='coerce')
+
+        if converted.notna().sum() >= min_ratio * len(values):
+            numeric_columns[col] = pd.to_numeric(df[col], errors='coerce') if sampled \
+                else converted.reindex(df.index)
+
+    return numeric_columns
+
+
 def set_reference(df: DataFrame):
-    reference: str = '{0}-{1}-{2}-{3}'.format(
+    df['REFERENCE'] = get_reference(df)
+    return df
+
+
+def get_reference(df: DataFrame) -> str:
+    return '{0}-{1}-{2}-{3}'.format(
         df['EVENT HEADER - TIME (YY)'][0].astype(str),
         df['EVENT HEADER - TIME (MM)'][0].astype(str),
         df['EVENT HEADER - TIME (DD)'][0].astype(str),
         df['EVENT HEADER - TIME (HH)'][0].astype(str),)
-
-    df['REFERENCE'] = reference
-    return df
@@ -0,0 +1,151 @@
+import os
+import re
+import zipfile
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Tuple, Union, BinaryIO, Generator
+
+import numpy as np
+from pandas import DataFrame
+
+from src.types import ImportData
+
+Token = Tuple[str, Union[str, float, None], Union[str, float]]
+
+
+class ColumnBuilder:
+    """
+    Collects the events of a single identifier column by column
+    """
+    def __init__(self):
+        self.columns: Dict[str, list] = dict()
+        self.length: int = 0
+
+    def add_event(self, event: List[Tuple[str, object]]) -> None:
+        occurrences: Dict[str, int] = dict()
+
+        for name, value in event:
+            # rename columns with the same name to col+.i
+            count: int = occurrences.get(name, 0)
+            occurrences[name] = count + 1
+            if count > 0:
+                name = '{0}.{1}'.format(name, count)
+
+            column: Union[list, None] = self.columns.get(name)
+            if column is None:
+                # a new column is empty for all previous events
+                column = self.columns[name] = [np.nan] * self.length
+            column.append(value)
+
+        self.length += 1
+
+        # columns which are missing in this event are empty
+        for column in self.columns.values():
+            if len(column) < self.length:
+                column.append(np.nan)
+
+    def to_frame(self) -> DataFrame:
+        return DataFrame(self.columns).dropna(axis=1, how='all')
+
+
+class EventAssembler:
+    """
+    Routes every event straight into the ColumnBuilder of its identifier
+    """
+    identifier_column: str = 'EVENT HEADER - IDENTIFIER'
+
+    def __init__(self):
+        # builders are kept in order of first appearance, so the first event always belongs to the first identifier
+        self.builders: Dict[str, ColumnBuilder] = dict()
+
+    def add_event(self, event: List[Tuple[str, object]]) -> None:
+        identifier = next((value for name, value in event if name == self.identifier_column), None)
+
+        if not isinstance(identifier, str):
+            # events without an identifier can not be assigned to a DataFrame
+            return
+
+        if identifier not in self.builders:
+            self.builders[identifier] = ColumnBuilder()
+
+        self.builders[identifier].add_event(event)
+
+    def add_tokens(self, tokens: Iterable[Token]) -> None:
+        """
+        Group a stream of (name, value, event number) tokens to events
+        """
+        event: List[Tuple[str, object]] = list()
+        current_event = None
+
+        for name, value, event_number in tokens:
+            if not isinstance(event_number, str):
+                # data before the first event number does not belong to any event
+                continue
+
+            if event_number != current_event:
+                self.add_event(event)
+                event = list()
+                current_event = event_number
+
+            event.append((name, value))
+
+        self.add_event(event)
+
+    def to_frames(self) -> ImportData:
+        return {identifier: builder.to_frame() for identifier, builder in self.builders.items()}
+
+
+def assemble_events(tokens: Iterable[Token]) -> ImportData:
+    """
+    Create a separate DataFrame for every identifier where every event is a row
+    """
+    assembler: EventAssembler = EventAssembler()
+    assembler.add_tokens(tokens)
+
+    return assembler.to_frames()
+
+
+@contextmanager
+def open_file(path: str) -> Generator[BinaryIO, None, None]:
+    """
+    Open a file for reading. A file inside a zip archive (archive.zip/member.txt) is read straight from the archive
+    """
+    archive, member = split_zip_path(path)
+
+    if archive is None:
+        with open(path, 'rb') as f:
+            yield f
+    else:
+        with zipfile.ZipFile(archive, 'r') as zip_ref, zip_ref.open(member, 'r') as f:
+            yield f
+
+
+def get_file_size(path: str) -> int:
+    """
+    Returns the (uncompressed) size of a file, which can be inside a zip archive. A file which can not be read
+    has no size, it fails on import instead
+    """
+    try:
+        archive, member = split_zip_path(path)
+
+        if archive is None:
+            return os.path.getsize(path)
+
+        with zipfile.ZipFile(archive, 'r') as zip_ref:
+            return zip_ref.getinfo(member).file_size
+    except (OSError, KeyError):
+        return 0
+
+
+def split_zip_path(path: str) -> Tuple[Union[str, None], Union[str, None]]:
+    """
+    Split a path into the zip archive and the member inside that archive. Returns None when the path is no zip member
+    """
+    if os.path.isfile(path):
+        return None, None
+
+    for match in re.finditer(r'\.zip[/\\]', path, flags=re.IGNORECASE):
+        archive: str = path[:match.end() - 1]
+        if zipfile.is_zipfile(archive):
+            return archive, path[match.end():].replace('\\', '/')
+
+    return None, None
@@ -1,4 +1,5 @@
 from abc import abstractmethod
+from typing import List, Dict
 
 from pandas import DataFrame
 
@@ -7,3 +8,17 @@ class IConverter:
     @abstractmethod
     def convert(self, df: DataFrame, **kwargs) -> DataFrame:
         raise NotImplementedError
+
+    def get_columns(self, name: str, columns: List[str], scientific_cols: List[str]) -> List[str]:
+        """
+        Returns the columns of an identifier this converter needs, an empty list when it would not change anything.
+        Converters which do not know their columns up front get all columns
+        """
+        return list(columns)
+
+    def get_formats(self, name: str, columns: List[str], scientific_cols: List[str]) -> Dict[str, str]:
+        """
+        Returns the display format of the columns this converter keeps numeric, when the conversion succeeds.
+        A converter returns the DataFrame it was given when the conversion fails
+        """
+        return dict()
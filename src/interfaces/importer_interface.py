@@ -1,8 +1,13 @@
 from abc import abstractmethod
-from pandas import DataFrame
+
+from src.types import ImportData
 
 
 class IImporter:
+    # every importer defines its version, increase it whenever the output of the importer changes,
+    # this invalidates previously cached imports
+    version: str
+
     @abstractmethod
-    def import_(self, path: str, **kwargs) -> DataFrame:
+    def import_(self, path: str, **kwargs) -> ImportData:
         raise NotImplementedError
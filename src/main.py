@@ -1,7 +1,10 @@
 import sys
+from multiprocessing import freeze_support
 
 from src.controllers.mer_controller import MerController
 
 if __name__ == '__main__':
+    # imports run in worker processes, which need this when running as frozen executable
+    freeze_support()
     controller = MerController()
     sys.exit(controller.run())
@@ -1,13 +1,22 @@
+import threading
 from dataclasses import dataclass
-from typing import List
+from typing import List, Dict, Tuple, Union, Callable
 
+import numpy as np
 from PyQt5.QtCore import pyqtSignal, QObject, Qt
 from pandas import DataFrame
 
 from src.dataclasses.filter import Filter
+from src.dataclasses.filter_range import FilterRange
+from src.exceptions import FilterCancelledException
 from src.log import get_logger
+from src.models.utility import format_column, contains_text, is_plain_text, parse_filter_range, get_sort_keys, \
+    get_sort_key
 from src.utility import get_exception
 
+# the number of rows a filter searches before it checks whether it has been cancelled
+FILTER_CHUNK_SIZE: int = 10000
+
 
 @dataclass
 class DataFrameModel(QObject):
@@ -20,8 +29,16 @@ class DataFrameModel(QObject):
         self.name: str = name
         self.filters: dict[str, Filter] = dict()
 
-        # this is the unfiltered DataFrame
-        self.original_df: DataFrame = df.copy()
+        # the display format of converted columns, these columns keep their numeric values
+        self.formats: Dict[str, str] = dict()
+
+        # filters can be evaluated in the background, only the latest evaluation is not cancelled and
+        # one evaluation at a time uses the cached text and masks
+        self._filter_generation: int = 0
+        self._filter_lock: threading.Lock = threading.Lock()
+
+        # this is the unfiltered DataFrame, it is not copied here as renaming its columns returns a new DataFrame
+        self.original_df: DataFrame = df
         self.rename_columns()
 
     @property
@@ -30,22 +47,33 @@ class DataFrameModel(QObject):
 
     @original_df.setter
     def original_df(self, value):
-        self._original_df = value
-        self.df = value
+        self.cancel_filters()
+
+        with self._filter_lock:
+            self._original_df = value
+            self.df = value
+
+            # the lowercase text of every filtered column, built again when a column is filtered after this
+            self._lower_columns: Dict[str, Tuple[Union[str, None], np.ndarray]] = dict()
+            # the last expression of every column filter with the rows it was found in
+            self._filter_masks: Dict[str, Tuple[str, np.ndarray]] = dict()
+            # the rows of every column range filtered on in sorted order, with their sorted values
+            self._sorted_columns: Dict[str, Union[Tuple[np.ndarray, np.ndarray], None]] = dict()
+            # the rows which passed all filters the last time they were applied
+            self._row_mask: np.ndarray = np.ones(len(value), dtype=bool)
 
     def rename_columns(self) -> None:
         """
         Remove the identifier notation from the column names
         """
-        for col_old in self.original_df.columns:
-            try:
-                search: str = ' - '
-                i = col_old.index(search) + len(search)
-                col_new: str = col_old[i:]
-                self.original_df = self.original_df.rename(columns={col_old: col_new})
-            except Exception:
-                # search not found
-                pass
+        search: str = ' - '
+
+        def rename(x):
+            return x[x.index(search) + len(search):] if isinstance(x, str) and search in x else x
+
+        # rename all columns at once, renaming them one by one copies the whole DataFrame for every column
+        self.original_df = self.original_df.rename(columns=rename)
+        self.formats = {rename(name): display_format for name, display_format in self.formats.items()}
 
     def init_filters(self) -> None:
         """
@@ -56,11 +84,14 @@ class DataFrameModel(QObject):
 
     def set_column(self, name: str, active: Qt.CheckState) -> None:
         """
-        Toggle a column
+        Toggle a column, the rows stay filtered
         """
 
         self.filters[name].column_active = (active == Qt.Checked)
 
+        self.df = self.original_df.loc[self._row_mask, self.get_active_columns()]
+        self.model_changed_emit()
+
     def set_filter(self, name: str, expr: str, enabled: bool = True) -> None:
         """
         Toggle or set a Filter expression
@@ -79,20 +110,170 @@ class DataFrameModel(QObject):
         self.apply_filters()
 
     def apply_filters(self) -> None:
-        df: DataFrame = self.original_df.copy()
+        """
+        Apply all filters at once, this cancels the filters which are evaluated in the background
+        """
+        self.cancel_filters()
+        self.set_row_mask(self.get_row_mask(self.get_active_filters()))
+
+    def cancel_filters(self) -> int:
+        """
+        Cancels all filter evaluations which are running, returns the generation of the next evaluation
+        """
+        self._filter_generation += 1
+
+        return self._filter_generation
+
+    def is_filter_cancelled(self, generation: int) -> bool:
+        return generation != self._filter_generation
 
-        for name, f in self.filters.items():
-            if f.filter_enabled & (f.expr != ''):
+    def get_active_filters(self) -> List[Tuple[str, str]]:
+        """
+        Returns the column and lowercase expression of every enabled filter
+        """
+        return [(name, f.expr.lower()) for name, f in self.filters.items() if f.filter_enabled & (f.expr != '')]
+
+    def get_row_mask(self, filters: List[Tuple[str, str]],
+                     is_cancelled: Callable[[], bool] = lambda: False) -> np.ndarray:
+        """
+        Returns the rows which pass all filters, only filters of which the expression changed search the column again.
+        Raises a FilterCancelledException when the evaluation is cancelled
+        """
+        with self._filter_lock:
+            mask: np.ndarray = np.ones(len(self.original_df), dtype=bool)
+
+            for name, expr in filters:
                 try:
                     # apply filter expression
-                    df = df[df[name].apply(str).str.lower().str.contains(f.expr.lower())]
+                    mask &= self.get_filter_mask(name, expr, is_cancelled)
+                except FilterCancelledException:
+                    raise
                 except Exception as e:
                     self.logger.error(get_exception(e))
 
+            return mask
+
+    def set_row_mask(self, mask: np.ndarray) -> None:
+        """
+        Shows the rows which passed all filters
+        """
+        self._row_mask = mask
+
         # filter df on selected columns
-        self.df = df[self.get_active_columns()]
+        self.df = self.original_df.loc[mask, self.get_active_columns()]
         self.model_changed_emit()
 
+    def get_filter_mask(self, name: str, expr: str, is_cancelled: Callable[[], bool] = lambda: False) -> np.ndarray:
+        """
+        Returns the rows of a column which pass a filter expression. Range expressions on numeric, timestamp and
+        duration columns compare the values, all other expressions are searched in the lowercase text of the column.
+        The mask of the previous expression of the column is kept, when the expression is extended only the rows
+        in which the previous expression was found are searched
+        """
+        filter_range: Union[FilterRange, None] = parse_filter_range(expr)
+
+        if filter_range is not None:
+            mask: Union[np.ndarray, None] = self.get_range_mask(name, filter_range)
+
+            # bounds which are no values of the column are searched as text
+            if mask is not None:
+                return mask
+
+        text: np.ndarray = self.get_lower_column(name)
+        previous: Union[Tuple[str, np.ndarray], None] = self._filter_masks.get(name)
+
+        if previous is not None and previous[0] == expr:
+            return previous[1]
+
+        mask: np.ndarray = np.zeros(len(text), dtype=bool)
+
+        if previous is not None and is_plain_text(previous[0]) and is_plain_text(expr) and previous[0] in expr:
+            # text which contains the new expression also contains the previous one
+            rows: np.ndarray = np.flatnonzero(previous[1])
+        else:
+            rows: np.ndarray = np.arange(len(text))
+
+        for start in range(0, len(rows), FILTER_CHUNK_SIZE):
+            if is_cancelled():
+                raise FilterCancelledException(name)
+
+            chunk: np.ndarray = rows[start:start + FILTER_CHUNK_SIZE]
+            mask[chunk] = contains_text(text[chunk], expr)
+
+        self._filter_masks[name] = (expr, mask)
+
+        return mask
+
+    def get_range_mask(self, name: str, filter_range: FilterRange) -> Union[np.ndarray, None]:
+        """
+        Returns the rows of a column with a value within a range, found by a binary search of the sorted values.
+        Returns None for text columns and bounds which are no values of the column
+        """
+        sorted_column: Union[Tuple[np.ndarray, np.ndarray], None] = self.get_sorted_column(name)
+
+        if sorted_column is None:
+            return None
+
+        rows, values = sorted_column
+
+        try:
+            lower = None if filter_range.lower is None else get_sort_key(name, self.original_df[name], filter_range.lower)
+            upper = None if filter_range.upper is None else get_sort_key(name, self.original_df[name], filter_range.upper)
+        except (ValueError, TypeError, OverflowError):
+            return None
+
+        start: int = 0 if lower is None else \
+            np.searchsorted(values, lower, side='left' if filter_range.include_lower else 'right')
+        end: int = len(values) if upper is None else \
+            np.searchsorted(values, upper, side='right' if filter_range.include_upper else 'left')
+
+        mask: np.ndarray = np.zeros(len(self.original_df), dtype=bool)
+        mask[rows[start:max(start, end)]] = True
+
+        return mask
+
+    def get_sorted_column(self, name: str) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+        """
+        Returns the rows of a column in the order of their values and the sorted values, missing values are left out.
+        It is only sorted once, None is returned for text columns
+        """
+        if name not in self._sorted_columns:
+            keys: Union[Tuple[np.ndarray, np.ndarray], None] = get_sort_keys(name, self.original_df[name])
+
+            if keys is None:
+                self._sorted_columns[name] = None
+            else:
+                values, valid = keys
+                rows: np.ndarray = np.flatnonzero(valid)
+                rows = rows[np.argsort(values[rows], kind='stable')]
+
+                self._sorted_columns[name] = (rows, values[rows])
+
+        return self._sorted_columns[name]
+
+    def get_lower_column(self, name: str) -> np.ndarray:
+        """
+        Returns the lowercase text shown for every value of a column, it is only built once
+        """
+        display_format: Union[str, None] = self.formats.get(name)
+
+        if name not in self._lower_columns or self._lower_columns[name][0] != display_format:
+            text: np.ndarray = format_column(name, self.original_df[name], display_format).str.lower().to_numpy()
+            self._lower_columns[name] = (display_format, text)
+            self._filter_masks.pop(name, None)
+
+        return self._lower_columns[name][1]
+
+    def get_position(self, row: int, name: str) -> Union[Tuple[int, int], None]:
+        """
+        Returns the position in the filtered DataFrame of a cell of the unfiltered DataFrame,
+        None when the cell is hidden by a filter or its column is not active
+        """
+        if not self._row_mask[row] or name not in self.df.columns:
+            return None
+
+        return int(np.count_nonzero(self._row_mask[:row])), self.df.columns.get_loc(name)
+
     def get_active_columns(self) -> List[str]:
         """
         Returns all active columns
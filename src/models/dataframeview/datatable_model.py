@@ -1,6 +1,7 @@
 from PyQt5 import QtCore
 
 from src.models.dataframe_model import DataFrameModel
+from src.models.utility import format_value
 
 
 class DataTableModel(QtCore.QAbstractTableModel):
@@ -24,5 +25,6 @@ class DataTableModel(QtCore.QAbstractTableModel):
             row = index.row()
             col = index.column()
             cell = self.dfm.df.iloc[row, col]
+            name = self.dfm.df.columns[col]
 
-            return str(cell)
+            return format_value(name, cell, self.dfm.formats.get(name))
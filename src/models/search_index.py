@@ -0,0 +1,152 @@
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from src.dataclasses.search_hit import SearchHit
+from src.log import get_logger
+from src.models.utility import format_column
+from src.types import MerData
+
+# the number of hits a search returns, the total number of hits is counted as well
+MAX_SEARCH_HITS: int = 1000
+
+
+class SearchIndex:
+    """
+    A trigram index over the text shown for every cell of all identifiers, searched case insensitive.
+    Every distinct text is indexed once, the cells which show a text are found in a list sorted by text
+    """
+    logger = get_logger(__name__)
+
+    def __init__(self, data: MerData, blocks: List[Tuple[str, str]], texts: np.ndarray,
+                 trigrams: Dict[str, np.ndarray], offsets: np.ndarray, cell_blocks: np.ndarray, cell_rows: np.ndarray):
+        self.data: MerData = data
+        # the identifier and column of every block of cells
+        self.blocks: List[Tuple[str, str]] = blocks
+        # every distinct lowercase text, with the texts which contain a trigram
+        self.texts: np.ndarray = texts
+        self.trigrams: Dict[str, np.ndarray] = trigrams
+        # the cells showing text i are cells offsets[i] until offsets[i + 1]
+        self.offsets: np.ndarray = offsets
+        self.cell_blocks: np.ndarray = cell_blocks
+        self.cell_rows: np.ndarray = cell_rows
+
+    def search(self, expr: str, limit: int = MAX_SEARCH_HITS) -> Tuple[List[SearchHit], int]:
+        """
+        Returns the first cells, by identifier, column and row, which contain a text and the number of these cells
+        """
+        expr = expr.lower()
+
+        if expr == '':
+            return list(), 0
+
+        texts: np.ndarray = self.find_texts(expr)
+
+        # positions of all cells of the texts which were found
+        starts: np.ndarray = self.offsets[texts]
+        counts: np.ndarray = self.offsets[texts + 1] - starts
+        total: int = int(counts.sum())
+
+        cells: np.ndarray = np.repeat(starts - np.cumsum(counts) + counts, counts) + np.arange(total)
+        keys: np.ndarray = (self.cell_blocks[cells].astype(np.int64) << 32) | self.cell_rows[cells]
+
+        if total > limit:
+            keys = np.partition(keys, limit - 1)[:limit]
+
+        keys = np.sort(keys)
+
+        return self.create_hits(keys >> 32, keys & 0xFFFFFFFF), total
+
+    def find_texts(self, expr: str) -> np.ndarray:
+        """
+        Returns the distinct texts which contain an expression. Only texts which contain all trigrams of the
+        expression are compared, shorter expressions are compared with all texts
+        """
+        candidates: np.ndarray = np.arange(len(self.texts))
+
+        for trigram in sorted(get_trigrams(expr), key=lambda x: len(self.trigrams.get(x, ()))):
+            candidates = np.intersect1d(candidates, self.trigrams.get(trigram, candidates[:0]), assume_unique=True)
+
+            if len(candidates) == 0:
+                break
+
+        return candidates[np.fromiter((expr in text for text in self.texts[candidates]), dtype=bool,
+                                      count=len(candidates))]
+
+    def create_hits(self, blocks: np.ndarray, rows: np.ndarray) -> List[SearchHit]:
+        """
+        Returns the hits of cells sorted by block, the text of the cells of a block is formatted at once
+        """
+        hits: List[SearchHit] = list()
+
+        for block in np.unique(blocks):
+            identifier, column = self.blocks[block]
+            dfm = self.data[identifier]
+
+            block_rows: np.ndarray = rows[blocks == block]
+            text: pd.Series = format_column(column, dfm.original_df[column].iloc[block_rows], dfm.formats.get(column))
+
+            hits.extend(SearchHit(identifier, int(row), column, value) for row, value in zip(block_rows, text))
+
+        return hits
+
+
+def create_search_index(data: MerData) -> SearchIndex:
+    """
+    Indexes the text shown for every cell of all identifiers
+    """
+    # the id of every distinct text, in order of appearance
+    text_ids: Dict[str, int] = dict()
+
+    blocks: List[Tuple[str, str]] = list()
+    cell_texts: List[np.ndarray] = list()
+
+    for identifier, dfm in data.items():
+        if len(dfm.original_df) == 0:
+            continue
+
+        for column in dfm.original_df.columns:
+            text: pd.Series = format_column(column, dfm.original_df[column], dfm.formats.get(column)).str.lower()
+
+            # every distinct text of a column is looked up once
+            codes, uniques = pd.factorize(text)
+            ids: np.ndarray = np.fromiter((text_ids.setdefault(value, len(text_ids)) for value in uniques),
+                                          dtype=np.int32, count=len(uniques))
+
+            blocks.append((identifier, column))
+            cell_texts.append(ids[codes])
+
+    texts: np.ndarray = np.array(list(text_ids), dtype=object)
+
+    # sort all cells by their text
+    all_texts: np.ndarray = np.concatenate(cell_texts) if cell_texts else np.empty(0, dtype=np.int32)
+    order: np.ndarray = np.argsort(all_texts, kind='stable')
+
+    cell_blocks: np.ndarray = np.repeat(np.arange(len(blocks), dtype=np.int32),
+                                        [len(block) for block in cell_texts])[order]
+    cell_rows: np.ndarray = np.concatenate(
+        [np.arange(len(block), dtype=np.int32) for block in cell_texts])[order] if cell_texts else all_texts
+    offsets: np.ndarray = np.searchsorted(all_texts[order], np.arange(len(texts) + 1))
+
+    SearchIndex.logger.debug('Indexed {0} cells with {1} distinct texts'.format(len(all_texts), len(texts)))
+
+    return SearchIndex(data, blocks, texts, get_trigram_index(texts), offsets, cell_blocks, cell_rows)
+
+
+def get_trigram_index(texts: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Returns the texts (sorted ids) which contain every trigram
+    """
+    index: Dict[str, List[int]] = defaultdict(list)
+
+    for i, text in enumerate(texts):
+        for trigram in get_trigrams(text):
+            index[trigram].append(i)
+
+    return {trigram: np.array(ids, dtype=np.int64) for trigram, ids in index.items()}
+
+
+def get_trigrams(text: str) -> set:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
@@ -0,0 +1,169 @@
+import re
+from typing import Dict, Union, Tuple
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
+from pandas.api.types import is_datetime64_any_dtype, is_timedelta64_dtype, is_numeric_dtype
+
+from src.converters.utility import format_values
+from src.dataclasses.filter_range import FilterRange
+
+# timestamps are kept as datetime64, these columns only show the date part, all others only the time of day
+DATE_COLUMNS = frozenset(['DATE_'])
+DATE_FORMAT: str = '%Y-%m-%d'
+TIME_FORMAT: str = '%H:%M:%S'
+
+
+def get_datetime_format(name: str) -> str:
+    return DATE_FORMAT if name in DATE_COLUMNS else TIME_FORMAT
+
+
+def format_value(name: str, value, display_format: Union[str, None] = None) -> str:
+    """
+    Returns the text shown for a single value of a column
+    """
+    if display_format is not None:
+        return str(format_values(display_format, [value])[0])
+
+    if isinstance(value, pd.Timestamp):
+        return value.strftime(get_datetime_format(name))
+
+    return str(value)
+
+
+def format_column(name: str, column: Series, display_format: Union[str, None] = None) -> Series:
+    """
+    Returns the text shown for every value of a column
+    """
+    if display_format is not None:
+        return Series(format_values(display_format, column), index=column.index).fillna(str(np.nan))
+
+    if is_datetime64_any_dtype(column):
+        return column.dt.strftime(get_datetime_format(name)).fillna(str(pd.NaT))
+
+    return column.apply(str)
+
+
+# characters which give a regular expression another meaning than the text itself
+REGEX_CHARACTERS = frozenset('.^$*+?{}[]\\|()')
+
+
+def is_plain_text(expr: str) -> bool:
+    return REGEX_CHARACTERS.isdisjoint(expr)
+
+
+def contains_text(text: np.ndarray, expr: str) -> np.ndarray:
+    """
+    Returns which values contain a regular expression, like Series.str.contains.
+    Expressions without special characters are searched as plain text
+    """
+    if is_plain_text(expr):
+        return np.fromiter((expr in value for value in text), dtype=bool, count=len(text))
+
+    pattern: re.Pattern = re.compile(expr)
+
+    return np.fromiter((pattern.search(value) is not None for value in text), dtype=bool, count=len(text))
+
+
+# separates the bounds of a range filter, like 2..5
+RANGE_SEPARATOR: str = '..'
+NANOSECONDS_PER_DAY: int = 86400 * 1000000000
+
+
+def parse_filter_range(expr: str) -> Union[FilterRange, None]:
+    """
+    Parses the typed filter expressions >value, >=value, <value, <=value, =value and lower..upper (both included,
+    either can be left out). Other expressions are regular expressions which are searched in the text of a column
+    """
+    for operator, include in (('>=', True), ('<=', True), ('>', False), ('<', False)):
+        if expr.startswith(operator):
+            value: str = expr[len(operator):].strip()
+
+            return FilterRange(lower=value, include_lower=include) if operator[0] == '>' else \
+                FilterRange(upper=value, include_upper=include)
+
+    if expr.startswith('='):
+        return FilterRange(expr[1:].strip(), expr[1:].strip())
+
+    if RANGE_SEPARATOR in expr:
+        lower, upper = expr.split(RANGE_SEPARATOR, 1)
+
+        return FilterRange(lower.strip() or None, upper.strip() or None)
+
+    return None
+
+
+def get_sort_keys(name: str, column: Series) -> Union[Tuple[np.ndarray, np.ndarray], None]:
+    """
+    Returns the values range filters compare a column on and which values are not missing, None for text columns.
+    Timestamps are compared on the part which is shown, their date or their time of day
+    """
+    if is_datetime64_any_dtype(column) or is_timedelta64_dtype(column):
+        nanoseconds: np.ndarray = column.to_numpy().view(np.int64)
+        valid: np.ndarray = ~pd.isna(column).to_numpy()
+
+        if is_timedelta64_dtype(column):
+            return nanoseconds, valid
+
+        return (nanoseconds // NANOSECONDS_PER_DAY if name in DATE_COLUMNS else
+                nanoseconds % NANOSECONDS_PER_DAY), valid
+
+    if is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column):
+        values: np.ndarray = column.to_numpy(dtype=float)
+
+        return values, ~np.isnan(values)
+
+    return None
+
+
+def get_sort_key(name: str, column: Series, value: str):
+    """
+    Returns the value range filters compare a typed bound on, like get_sort_keys.
+    Raises a ValueError when the bound is no value of the column
+    """
+    if is_datetime64_any_dtype(column) or is_timedelta64_dtype(column):
+        bound = pd.Timedelta(value) if is_timedelta64_dtype(column) else pd.Timestamp(value)
+
+        if pd.isna(bound):
+            raise ValueError('Bound is not a {0}: {1}'.format(column.dtype, value))
+
+        if is_timedelta64_dtype(column):
+            return bound.value
+
+        nanoseconds: int = bound.value
+
+        return nanoseconds // NANOSECONDS_PER_DAY if name in DATE_COLUMNS else nanoseconds % NANOSECONDS_PER_DAY
+
+    number: float = float(value)
+
+    if np.isnan(number):
+        raise ValueError('Bound is not a number: {0}'.format(value))
+
+    return number
+
+
+def split_datetime_columns(df: DataFrame) -> DataFrame:
+    """
+    Returns a copy with the timestamps split into dates and times of day, for exporting
+    """
+    df = df.copy()
+
+    for name in df.columns[[is_datetime64_any_dtype(dtype) for dtype in df.dtypes]]:
+        df[name] = df[name].dt.date if name in DATE_COLUMNS else df[name].dt.time
+
+    return df
+
+
+def format_frame(df: DataFrame, formats: Dict[str, str]) -> DataFrame:
+    """
+    Returns a copy with the timestamps split and the columns with a display format formatted, for exporting.
+    Values which can not be formatted stay empty
+    """
+    df = split_datetime_columns(df)
+
+    for name, display_format in formats.items():
+        if name in df.columns:
+            df[name] = Series(format_values(display_format, df[name]), index=df.index)
+
+    return df
@@ -1,24 +1,30 @@
-from typing import List
+from concurrent.futures import Future
+from typing import List, Dict, Tuple, Union, Any
+
 from PyQt5.QtCore import QThread
 from pandas import DataFrame
 
 from src.converters.degrees2coordinates_converter import DegreesToCoordinatesConverter
 from src.converters.degrees_converter import DegreesConverter
+from src.converters.geodesy import create_grid_centers
 from src.converters.reference_converter import ReferenceConverter
 from src.converters.sonarplan_converter import SonarPlanConverter
 from src.converters.sonic_converter import SonicConverter
 from src.converters.time_converter import TimeConverter
 from src.converters.yards2coordinates_converter import IConverter, YardsToCoordinatesConverter
 from src.converters.yards_to_nm_converter import YardsToNMConverter
+from src.dataclasses.convert_step import ConvertStep
+from src.dataclasses.grid_centers import GridCenters
 from src.tasks.TaskBase import TaskBase
+from src.tasks.utility import convert_frame, create_executor, get_convert_cost, get_display_formats
 from src.types import MerData
 from src.utility import get_exception
-import numpy as np
 
 from src.log import get_logger
 
 converters = [
-    TimeConverter(),
+    # sonobuoy durations stay timedelta64, they are formatted when shown, filtered on or exported
+    TimeConverter(native_durations=True),
     SonicConverter(),
     DegreesConverter(),
     YardsToNMConverter(),
@@ -28,6 +34,13 @@ converters = [
     ReferenceConverter()
 ]
 
+# the number of cells of the identifiers which are converted in worker processes,
+# converting fewer cells takes less time than starting the workers
+MIN_PROCESS_CONVERT_SIZE: int = 5000000
+
+# state of a worker process, set once by init_worker
+worker: Dict[str, Any] = dict()
+
 
 class ConvertTask(TaskBase):
     logger = get_logger(__name__)
@@ -41,6 +54,9 @@ class ConvertTask(TaskBase):
         self.converters: List[IConverter] = list()
         self.init_converters()
 
+        # the converters run per identifier and the columns they converted, for debugging
+        self.plan: List[ConvertStep] = list()
+
     def run(self) -> None:
         try:
             self.emit_busy('Start convert')
@@ -52,24 +68,43 @@ class ConvertTask(TaskBase):
         self.emit_busy('Converting data')
 
         data = self.data.copy()
-        # hold tactical scenario
-        tact_scenario: DataFrame = data['TACTICAL_SCENARIO'].original_df
+        # hold tactical scenario, the tactical scenario itself is converted in place as well
+        tact_scenario: DataFrame = data['TACTICAL_SCENARIO'].original_df.copy()
+
+        # the grid center of every reference is computed once for all position converters,
+        # without grid centers these converters fail (and log) on their own
+        grid_centers: Union[GridCenters, None] = None
+        try:
+            grid_centers = create_grid_centers(tact_scenario)
+        except KeyError as e:
+            self.logger.error('No grid centers in tactical scenario: ' + get_exception(e))
+
+        self.plan = list()
+
+        # identifiers are converted independently, the largest identifiers are started first
+        names: List[str] = sorted(data, key=lambda x: get_convert_cost(data[x].original_df), reverse=True)
+
+        # apply all converters to each model of the MerData object
+        # the converters, tactical scenario and grid centers are the same for every identifier,
+        # so they are sent to each worker once instead of with every identifier
+        size: int = sum(get_convert_cost(data[name].original_df) for name in names)
+
+        with create_executor(len(names), size, MIN_PROCESS_CONVERT_SIZE, initializer=init_worker,
+                             initargs=(self.converters, tact_scenario, grid_centers)) as executor:
+            futures: Dict[str, Future] = {
+                name: executor.submit(convert_identifier, data[name].name, data[name].original_df)
+                for name in names}
 
-        for converter in self.converters:
-            # apply all converters to each model of the MerData object
             for name, dfm in data.items():
-                # get scientific cols because only numeric cols will be converted
-                scientific_cols: List[str] = dfm.original_df.select_dtypes(include=np.number).columns.tolist()
-
-                converted_df: DataFrame = converter.convert(
-                    dfm.original_df,
-                    name=dfm.name,
-                    tact_scenario=tact_scenario,
-                    scientific_cols=scientific_cols
-                )
-                data[name].original_df = converted_df
+                df, plan = futures[name].result()
+                self.plan.extend(plan)
+
+                data[name].original_df = df
+                data[name].formats = get_display_formats(df, plan)
                 data[name].rename_columns()
 
+        self.logger.debug('Convert plan:\n' + '\n'.join(map(str, self.plan)))
+
         self.emit_busy('Convert success')
         self.task_finished.emit(data)
 
@@ -79,3 +114,25 @@ class ConvertTask(TaskBase):
     def init_converters(self):
         for c in converters:
             self.add_converter(c)
+
+
+def init_worker(worker_converters: List[IConverter], tact_scenario: DataFrame,
+                grid_centers: Union[GridCenters, None]) -> None:
+    """
+    Keep the converters and their keyword arguments in the worker, for all identifiers it converts
+    """
+    worker.clear()
+    worker.update({
+        'converters': worker_converters,
+        'kwargs': {'tact_scenario': tact_scenario, 'grid_centers': grid_centers}
+    })
+
+
+def convert_identifier(name: str, df: DataFrame) -> Tuple[DataFrame, List[ConvertStep]]:
+    """
+    Convert the DataFrame of an identifier and return it with the plan of the conversion.
+    This runs in a worker process, the converters and their keyword arguments are set by init_worker.
+    """
+    plan: List[ConvertStep] = convert_frame(df, name, worker['converters'], **worker['kwargs'])
+
+    return df, plan
@@ -0,0 +1,46 @@
+from typing import List, Tuple
+
+from PyQt5.QtCore import QThread
+
+from src.exceptions import FilterCancelledException
+from src.log import get_logger
+from src.models.dataframe_model import DataFrameModel
+from src.tasks.TaskBase import TaskBase
+from src.utility import get_exception
+
+
+class FilterTask(TaskBase):
+    """
+    Evaluates the filters of a DataFrameModel in the background, the rows which pass are only published
+    when no newer evaluation has been started in the meantime
+    """
+    logger = get_logger(__name__)
+
+    def __init__(self, dfm: DataFrameModel):
+        QThread.__init__(self)
+        self.dfm: DataFrameModel = dfm
+
+        # the filters are taken when the task is created, later changes start a new task
+        self.generation: int = dfm.cancel_filters()
+        self.filters: List[Tuple[str, str]] = dfm.get_active_filters()
+
+        self.task_finished.connect(self.publish)
+
+    def run(self) -> None:
+        try:
+            mask = self.dfm.get_row_mask(self.filters, self.is_cancelled)
+
+            if not self.is_cancelled():
+                self.task_finished.emit(mask)
+        except FilterCancelledException:
+            self.logger.debug('Filter cancelled {0}'.format(self.dfm.name))
+        except Exception as e:
+            self.emit_failed(get_exception(e))
+
+    def is_cancelled(self) -> bool:
+        return self.dfm.is_filter_cancelled(self.generation)
+
+    def publish(self, mask) -> None:
+        # a newer evaluation may have been started after the result was sent
+        if not self.is_cancelled():
+            self.dfm.set_row_mask(mask)
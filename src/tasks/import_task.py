@@ -1,20 +1,35 @@
 import os
-from typing import List, Dict
+from concurrent.futures import Future
+from typing import List, Dict, Union
 
 from PyQt5.QtCore import QThread
-from pandas import DataFrame
-import pandas as pd
 
 from src.importers.binary_importer import BinaryImporter
+from src.importers.import_cache import ImportCache
 from src.importers.text_importer import TextImporter
+from src.importers.utility import get_file_size
 from src.interfaces.importer_interface import IImporter
 from src.tasks.TaskBase import TaskBase
-from src.tasks.utility import get_valid_files, create_mer_data, empty_folder
-from src.types import MerData
+from src.tasks.utility import get_valid_files, create_mer_data, get_import_reference, merge_imports, \
+    create_executor
+from src.types import MerData, ImportData
 from src.utility import get_exception
 
 from src.log import get_logger
 
+# the total size (bytes) of the files from which they are imported in worker processes,
+# parsing smaller imports takes less time than starting the workers
+MIN_PROCESS_IMPORT_SIZE: int = 32 * 1024 * 1024
+
+# eventually this should only contain the binary types of the different systems
+# in that way we can just select the Mer importer for the Mer from SkyFlight,
+# the LFAPS importer for the LFAPS data etc.
+# this is only a temporary solution
+importers: Dict[str, IImporter] = {
+    'txt': TextImporter(),
+    'mer': BinaryImporter()
+}
+
 
 class ImportTask(TaskBase):
     logger = get_logger(__name__)
@@ -23,14 +38,12 @@ class ImportTask(TaskBase):
         QThread.__init__(self)
         self.paths: List[str] = paths
 
+        # imported Mers are cached, so reopening a Mer does not need to parse it again
+        self.cache: ImportCache = ImportCache()
+
         # add importers
-        # eventually this should only contain the binary types of the different systems
-        # in that way we can just select the Mer importer for the Mer from SkyFlight,
-        # the LFAPS importer for the LFAPS data etc.
-        # this is only a temporary solution
         self.importers: Dict[str, IImporter] = dict()
-        self.add_importer('txt', TextImporter())
-        self.add_importer('mer', BinaryImporter())
+        self.init_importers()
 
     def run(self) -> None:
         self.emit_busy('Start import')
@@ -41,40 +54,45 @@ class ImportTask(TaskBase):
 
     def import_from_paths(self, paths) -> None:
         all_paths: List[str] = get_valid_files(paths)
-        dfs: List[DataFrame] = list()
+        imports: List[ImportData] = list()
         references: List[str] = list()
+        reference_counts: Dict[str, int] = dict()
+
+        # import all files at once, but handle the results in order so references are set the same for every import
+        with create_executor(len(all_paths), sum(map(get_file_size, all_paths)), MIN_PROCESS_IMPORT_SIZE) as executor:
+            futures: List[Future] = [executor.submit(import_file, get_importer_type(path), path)
+                                     for path in all_paths]
 
-        for path in all_paths:
-            # define which importer is needed according to filetype
-            importer: str = os.path.splitext(path)[1][1:].lower()
+            for path, future in zip(all_paths, futures):
+                try:
+                    self.emit_busy('Importing {0}'.format(os.path.basename(path)))
 
-            try:
-                self.emit_busy('Importing {0}'.format(os.path.basename(path)))
+                    data: ImportData = future.result()
 
-                # pick the right importer for filetype
-                df: DataFrame = self.importers[importer].import_(path)
+                    reference = get_import_reference(data)
 
-                reference = df['REFERENCE'][0]
+                    count: int = reference_counts.get(reference, 0)
+                    reference_counts[reference] = count + 1
 
-                if reference in references:
-                    reference = '{0}_'.format(references.count(reference)) + reference
-                    df['REFERENCE'] = reference
+                    if count > 0:
+                        reference = '{0}_'.format(count) + reference
+                        for df in data.values():
+                            df['REFERENCE'] = reference
 
-                references.append(reference)
-                dfs.append(df)
+                    references.append(reference)
+                    imports.append(data)
 
-            except Exception as e:
-                self.logger.error(get_exception(e))
+                except Exception as e:
+                    self.logger.error(get_exception(e))
 
-        dfs = set_reference(dfs)
+        imports = set_reference(imports)
 
         try:
-            # concat all imported DataFrame
-            df: DataFrame = pd.concat(dfs, sort=False, ignore_index=True)
-            df: DataFrame = df.sort_values(by=['DATE_', 'TIME_'])
+            # concat all imported DataFrames per identifier
+            identifiers: ImportData = merge_imports(imports)
 
             # create MerData (dict with models)
-            mer_data: MerData = create_mer_data(df.copy())
+            mer_data: MerData = create_mer_data(identifiers)
 
             self.emit_busy('Import success')
 
@@ -87,32 +105,61 @@ class ImportTask(TaskBase):
             self.logger.error(get_exception(e))
             self.task_failed.emit('This import does not contain any valid Mer data')
 
-        empty_folder('temp')
-
     def add_importer(self, name: str, importer: IImporter):
         self.importers[name] = importer
 
+        # remove cached imports of previous versions of this importer
+        self.cache.invalidate(importer)
+
+    def init_importers(self):
+        for name, importer in importers.items():
+            self.add_importer(name, importer)
+
+
+def get_importer_type(path: str) -> str:
+    """
+    Returns the key of the importer of a file, which is its filetype
+    """
+    return os.path.splitext(path)[1][1:].lower()
 
-def set_reference(dfs):
-    for i, df in enumerate(dfs):
-        if 'TACTICAL_SCENARIO' not in list(df['EVENT HEADER - IDENTIFIER']):
-            current_reference = df['REFERENCE'][0]
+
+def import_file(key: str, path: str) -> ImportData:
+    """
+    Import a file, or load it from the cache when it has been imported before.
+    This runs in a worker process, so only the key of the importer and the path are sent to it,
+    the importer and the cache are created in the worker.
+    """
+    importer: IImporter = importers[key]
+    cache: ImportCache = ImportCache()
+
+    data: Union[ImportData, None] = cache.load(importer, path)
+
+    if data is None:
+        data = importer.import_(path)
+        cache.store(importer, path, data)
+
+    return data
+
+
+def set_reference(imports: List[ImportData]) -> List[ImportData]:
+    """
+    Mers without a tactical scenario get the tactical scenario of the Mer of the previous hour
+    """
+    # index the imports by reference once, the first import of a reference is used for the carry-over
+    references: Dict[str, ImportData] = dict()
+    for data in imports:
+        references.setdefault(get_import_reference(data), data)
+
+    for data in imports:
+        if 'TACTICAL_SCENARIO' not in data:
+            current_reference = get_import_reference(data)
             index_of_hour = current_reference.rfind('-') + 1
             hour = current_reference[index_of_hour:]
             previous_reference = current_reference[:index_of_hour] + str(int(hour) - 1)
 
-            matching_references = [df for df in dfs if df['REFERENCE'][0] == previous_reference]
-
-            if len(matching_references) > 0:
-                previous_df = matching_references[0]
-                if 'TACTICAL_SCENARIO' in list(previous_df['EVENT HEADER - IDENTIFIER']):
+            previous_data: Union[ImportData, None] = references.get(previous_reference)
 
-                    tact_row = previous_df.loc[previous_df['EVENT HEADER - IDENTIFIER'] == 'TACTICAL_SCENARIO']
-                    tact_row['REFERENCE'] = current_reference
-                    dfs[i] = df.append(tact_row)
-                else:
-                    continue
-            else:
-                continue
+            if previous_data is not None and 'TACTICAL_SCENARIO' in previous_data:
+                data['TACTICAL_SCENARIO'] = previous_data['TACTICAL_SCENARIO'].assign(REFERENCE=current_reference)
 
-    return dfs
+    return imports
@@ -0,0 +1,23 @@
+from PyQt5.QtCore import QThread
+
+from src.log import get_logger
+from src.models.search_index import create_search_index
+from src.tasks.TaskBase import TaskBase
+from src.types import MerData
+from src.utility import get_exception
+
+
+class IndexTask(TaskBase):
+    logger = get_logger(__name__)
+
+    def __init__(self, data: MerData):
+        QThread.__init__(self)
+        self.data: MerData = data
+
+    def run(self) -> None:
+        try:
+            self.logger.info('Start indexing')
+            self.task_finished.emit(create_search_index(self.data))
+            self.logger.info('Indexing success')
+        except Exception as e:
+            self.emit_failed('Indexing failed: ' + get_exception(e))
@@ -1,12 +1,19 @@
 import fnmatch
 import json
+import multiprocessing
 import os
 import zipfile
-from typing import List, Dict, Generator
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Callable, Tuple, Union
 
-from pandas import DataFrame
+import numpy as np
+import pandas as pd
+from pandas import DataFrame, Series
 
+from src.dataclasses.convert_step import ConvertStep
+from src.interfaces.converter_interface import IConverter
 from src.models.dataframe_model import DataFrameModel
+from src.types import ImportData
 
 
 def retrieve_preset(preset: str):
@@ -17,20 +24,167 @@ def retrieve_preset(preset: str):
     return dict(preset)
 
 
-def create_mer_data(df: DataFrame) -> Dict[str, DataFrameModel]:
+def create_mer_data(identifiers: ImportData) -> Dict[str, DataFrameModel]:
     mer_data: Dict[str, DataFrameModel] = dict()
 
     # create a dictionary of Identifiers and DataFrameModels
-    identifiers: Dict[str, DataFrame] = dict(tuple(df.groupby(['EVENT HEADER - IDENTIFIER'])))
+    for key in sorted(identifiers):
+        df: DataFrame = identifiers[key]
 
-    for key, df in identifiers.items():
-        # drop all empty columns
-        df: DataFrame = df.dropna(axis=1, how='all')
-        mer_data[key] = DataFrameModel(df.copy(), key)
+        # drop all empty columns, without copying the DataFrame when there are none
+        empty: Series = df.isna().all()
+        if empty.any():
+            df = df.loc[:, ~empty]
+
+        mer_data[key] = DataFrameModel(df, key)
 
     return mer_data
 
 
+def merge_imports(imports: List[ImportData]) -> ImportData:
+    """
+    Merge the DataFrames of all imported Mers per identifier in order of date/time
+    """
+    frames: Dict[str, List[DataFrame]] = dict()
+
+    for data in imports:
+        for key, df in data.items():
+            frames.setdefault(key, []).append(df)
+
+    if len(frames) == 0:
+        raise ValueError('No imported Mer data to merge')
+
+    # TIME_ is the timestamp of the event
+    return {key: merge_frames(dfs, 'TIME_') for key, dfs in frames.items()}
+
+
+def merge_frames(dfs: List[DataFrame], by: str) -> DataFrame:
+    """
+    Merge DataFrames into a single DataFrame sorted on the timestamp column by.
+    Events with the same timestamp keep the order of dfs.
+    """
+    keys: np.ndarray = np.concatenate([get_sort_keys(df[by]) for df in dfs])
+    df: DataFrame = pd.concat(dfs, sort=False, ignore_index=True)
+
+    # Mers which do not overlap in time are already in order after concatenating
+    if not is_sorted(keys):
+        # the events of a Mer are in order of time, so the keys consist of a sorted run per Mer.
+        # A stable sort (timsort) detects these runs and only merges them
+        df = df.take(np.argsort(keys, kind='stable'))
+        df.index = pd.RangeIndex(len(df))
+
+    return df
+
+
+def get_sort_keys(column: Series) -> np.ndarray:
+    """
+    Returns the timestamps as integers, missing timestamps are sorted last
+    """
+    timestamps: np.ndarray = column.to_numpy(dtype='datetime64[ns]')
+
+    return np.where(np.isnat(timestamps), np.iinfo(np.int64).max, timestamps.view(np.int64))
+
+
+def is_sorted(values: np.ndarray) -> bool:
+    return bool(np.all(values[1:] >= values[:-1]))
+
+
+def convert_frame(df: DataFrame, name: str, converters: List[IConverter], **kwargs) -> List[ConvertStep]:
+    """
+    Convert the DataFrame of an identifier in place and return the plan of the conversion,
+    the keyword arguments (tactical scenario, grid centers) are passed on to the converters.
+    The numeric columns are classified once, converters only get (a copy of) the columns they need and
+    only the columns they converted are classified again. Converters without columns are skipped.
+    Columns with a display format are no longer numeric to the converters after it
+    """
+    plan: List[ConvertStep] = list()
+    numeric: Dict[str, bool] = {col: False for col in df.columns}
+    numeric.update(dict.fromkeys(df.select_dtypes(include=np.number).columns, True))
+    formats: Dict[str, str] = dict()
+
+    for converter in converters:
+        scientific_cols: List[str] = [col for col in df.columns if numeric[col]]
+
+        columns: List[str] = [col for col in dict.fromkeys(
+            converter.get_columns(name, list(df.columns), scientific_cols)) if col in numeric]
+
+        if len(columns) == 0:
+            continue
+
+        subset_df: DataFrame = df[columns]
+        subset_scientific_cols: List[str] = [col for col in scientific_cols if col in columns]
+
+        converted_df: DataFrame = converter.convert(
+            subset_df,
+            name=name,
+            scientific_cols=subset_scientific_cols,
+            **kwargs
+        )
+
+        # a converter returns the DataFrame it was given when it fails
+        step_formats: Dict[str, str] = dict()
+        if converted_df is not subset_df:
+            step_formats = converter.get_formats(name, columns, subset_scientific_cols)
+
+        # write the converted columns back, columns removed by the converter are removed as well
+        for col in columns:
+            if col not in converted_df.columns:
+                del df[col]
+                del numeric[col]
+                formats.pop(col, None)
+
+        for col in converted_df.columns:
+            df[col] = converted_df[col]
+            numeric[col] = False
+
+        formats.update(step_formats)
+        numeric.update({col: col not in formats for col in converted_df.select_dtypes(include=np.number).columns})
+
+        plan.append(ConvertStep(name, type(converter).__name__, columns, step_formats))
+
+    return plan
+
+
+def get_display_formats(df: DataFrame, plan: List[ConvertStep]) -> Dict[str, str]:
+    """
+    Returns the display format of the columns of a DataFrame, as set by the steps of the plan of its conversion
+    """
+    formats: Dict[str, str] = {col: display_format for step in plan for col, display_format in step.formats.items()}
+
+    return {col: display_format for col, display_format in formats.items() if col in df.columns}
+
+
+def get_convert_cost(df: DataFrame) -> int:
+    """
+    Returns an estimate of the time needed to convert a DataFrame, the number of cells
+    """
+    return df.shape[0] * df.shape[1]
+
+
+def get_import_reference(data: ImportData) -> str:
+    """
+    Returns the reference of an imported Mer
+    """
+    return next(iter(data.values()))['REFERENCE'].iloc[0]
+
+
+def create_executor(task_count: int, work_size: int = 0, min_work_size: int = 0,
+                    initializer: Union[Callable, None] = None, initargs: Tuple = ()) -> Executor:
+    """
+    Returns a process pool sized to the number of cores. The workers are spawned, forking a process with running (Qt)
+    threads can deadlock. Spawning a worker imports the application again, so a single task or less work than
+    min_work_size (e.g. bytes or cells) runs on a single thread instead.
+    The initializer runs once per worker, with data shared by all tasks
+    """
+    workers: int = min(task_count, os.cpu_count() or 1)
+
+    if workers > 1 and work_size >= min_work_size:
+        return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                   initializer=initializer, initargs=initargs)
+
+    return ThreadPoolExecutor(max_workers=1, initializer=initializer, initargs=initargs)
+
+
 def get_valid_files(paths: List[str]) -> List[str]:
     """
     recursively get all paths to all files. When necessary unzip folder and get all files from it
@@ -51,31 +205,8 @@ def get_valid_files(paths: List[str]) -> List[str]:
 
 
 def get_txt_files_from_zip(path: str) -> List[str]:
-    # extract zip files and get the .txt files from it
-    dir_path = 'temp'
-
+    # get the .txt files from a zip file, these are read straight from the archive while importing
     with zipfile.ZipFile(path, 'r') as zip_ref:
-        zip_ref.extractall(dir_path)
-
-    txt_files = find_txt_files(dir_path)
-
-    return list(txt_files)
-
-
-def find_txt_files(path: str) -> Generator:
-    # recursively get all .txt files from a folder
-    for root, dirs, files in os.walk(path):
-        for file in fnmatch.filter(files, '*.txt'):
-            yield os.path.join(root, file)
-
-
-def empty_folder(path: str):
-    import os
-    import shutil
-
-    for root, dirs, files in os.walk(path):
-        for f in files:
-            os.unlink(os.path.join(root, f))
-        for d in dirs:
-            shutil.rmtree(os.path.join(root, d))
+        txt_files = fnmatch.filter(zip_ref.namelist(), '*.txt')
 
+    return ['{0}/{1}'.format(path, txt_file) for txt_file in txt_files]
@@ -4,8 +4,9 @@ from pandas import DataFrame
 
 from src.converters.degrees2coordinates_converter import DegreesToCoordinatesConverter, get_lat_cols, \
     convert_lat_long_cols
-from src.converters.utility import convert_degrees_to_coordinates
+from src.converters.utility import convert_degrees_to_coordinates, LATITUDE, LONGITUDE
 from src.interfaces.converter_interface import IConverter
+from src.models.utility import format_frame
 
 
 class DegreesToCoordinatesConverterTests(unittest.TestCase):
@@ -44,7 +45,12 @@ class DegreesToCoordinatesConverterTests(unittest.TestCase):
         Should correctly convert LAT LONG values to coordinate string in a DF
         """
 
-        actual = convert_lat_long_cols(self.df, list(self.df.columns)).values.tolist()
+        df = convert_lat_long_cols(self.df, list(self.df.columns))
+
+        self.assertEqual(self.df.values.tolist(), df.values.tolist())
+
+        actual = format_frame(df, {'POS1 LAT': LATITUDE, 'POS1 LONG': LONGITUDE,
+                                   'LAT POS2': LATITUDE, 'LONG POS2': LONGITUDE}).values.tolist()
         expect = [['N 53° 07\' 24"', 'W 008° 07\' 24"', 'N 48° 07\' 24"', 'W 007° 07\' 24"', 38.12345, 1.12345]]
 
         self.assertEqual(expect, actual)
@@ -55,7 +61,9 @@ class DegreesToCoordinatesConverterTests(unittest.TestCase):
         """
         converter: IConverter = DegreesToCoordinatesConverter()
 
-        actual = converter.convert(self.df, scientific_cols=list(self.df.columns)).values.tolist()
+        df = converter.convert(self.df, scientific_cols=list(self.df.columns))
+
+        actual = format_frame(df, converter.get_formats('CONTACT', list(df.columns), list(df.columns))).values.tolist()
         expect = [['N 53° 07\' 24"', 'W 008° 07\' 24"', 'N 48° 07\' 24"', 'W 007° 07\' 24"', 38.12345, 1.12345]]
 
         self.assertEqual(expect, actual)
@@ -1,6 +1,9 @@
 import unittest
+import numpy as np
 import pandas as pd
 from src.converters.degrees_converter import get_degrees_cols, convert_degrees, convert_degrees_cols, DegreesConverter
+from src.converters.utility import DEGREES
+from src.models.utility import format_frame
 
 
 class DegreesToCoordinatesConverterTests(unittest.TestCase):
@@ -47,7 +50,9 @@ class DegreesToCoordinatesConverterTests(unittest.TestCase):
         df = pd.DataFrame(columns=cols, data=[[0, 11, 100, 1, 10]])
         df = convert_degrees_cols(df, cols)
 
-        actual = df.values.tolist()
+        self.assertEqual([[0, 11, 100, 1, 10]], df.values.tolist())
+
+        actual = format_frame(df, dict.fromkeys(cols, DEGREES)).values.tolist()
         expect = [['000', '011', '100', '001', '010']]
 
         self.assertEqual(expect, actual)
@@ -61,7 +66,20 @@ class DegreesToCoordinatesConverterTests(unittest.TestCase):
         converter = DegreesConverter()
         df = converter.convert(df, scientific_cols=df.columns)
 
-        actual = df.values.tolist()
+        actual = format_frame(df, converter.get_formats('CONTACT', cols, cols)).values.tolist()
         expect = [['000', '011', '100', '001', '010']]
 
         self.assertEqual(expect, actual)
+
+    def test_convert_missing_values(self):
+        """
+        Should keep missing values missing and log values which can not be converted once per column
+        """
+        df = pd.DataFrame({'COURSE': [359.6, -90.5, np.nan, np.inf, np.inf]})
+
+        with self.assertLogs(DegreesConverter.logger, 'ERROR') as logs:
+            actual = convert_degrees_cols(df, ['COURSE'])['COURSE'].tolist()
+
+        self.assertEqual([0, 270], actual[:2])
+        self.assertTrue(np.isnan(actual[2:]).all())
+        self.assertEqual(['ERROR:src.converters.degrees_converter:2 values of COURSE could not be converted'], logs.output)
@@ -1,7 +1,9 @@
 import unittest
 
+import numpy as np
+
 from src.converters.utility import format_degrees_to_coordinate_lat, format_degrees_to_coordinate_long, format_minutes,\
-    format_degrees_long, format_degrees_lat
+    format_degrees_long, format_degrees_lat, format_degrees_to_coordinates, format_values, LATITUDE, LONGITUDE
 
 
 class DegreesToCoordinatesTests(unittest.TestCase):
@@ -60,3 +62,24 @@ class DegreesToCoordinatesTests(unittest.TestCase):
         for key, value in cases.items():
             with self.subTest(key=key):
                 self.assertEqual(value, format_degrees_lat(key))
+
+    def test_format_degrees_to_coordinates(self):
+        """
+        Should format arrays of lat and long degrees exactly like the single value formatters
+        """
+        lat = np.array([11.111, -11.111, 0.0, -0.0, 52.0916666, -33.9999999, 89.99999, np.nan, 10.0])
+        long = np.array([-1.1111, 1.1111, 0.0, -0.0, 4.525, -151.2083333, -179.99999, 10.0, np.inf])
+
+        lat_coordinates = format_values(LATITUDE, lat)
+        long_coordinates = format_values(LONGITUDE, long)
+
+        for i in range(7):
+            with self.subTest(lat=lat[i], long=long[i]):
+                self.assertEqual(format_degrees_to_coordinate_lat(lat[i]), lat_coordinates[i])
+                self.assertEqual(format_degrees_to_coordinate_long(long[i]), long_coordinates[i])
+
+        self.assertEqual(['S 11° 06\' 40"', 'E 001° 06\' 40"'], [lat_coordinates[1], long_coordinates[1]])
+        self.assertTrue(np.isnan(lat_coordinates[7]) and np.isnan(long_coordinates[8]))
+
+        _, valid = format_degrees_to_coordinates(long, 'E', 'W', 3)
+        self.assertEqual([True] * 8 + [False], valid.tolist())
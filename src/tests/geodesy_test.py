@@ -0,0 +1,69 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+from geopy.distance import geodesic
+
+from src.converters.geodesy import create_grid_centers, convert_yards_to_positions, convert_yards_to_degrees_array, \
+    get_distances, move_geo_points
+
+
+class GeodesyTests(unittest.TestCase):
+
+    tact_scenario = pd.DataFrame({
+        'GRID CENTER LAT': [50.08451, -33.5, 12.0],
+        'GRID CENTER LONG': [-5.243314, 151.25, 13.0],
+        'REFERENCE': ['19-10-10-10', '19-10-10-11', '19-10-10-10']
+    })
+
+    def test_create_grid_centers(self):
+        """
+        Should precompute the grid center of every reference once, the first tactical scenario of a reference is used
+        """
+        grid_centers = create_grid_centers(self.tact_scenario)
+
+        self.assertEqual(['19-10-10-10', '19-10-10-11'], grid_centers.references.tolist())
+        self.assertEqual([50.08451, -33.5], grid_centers.lat_deg.tolist())
+        self.assertEqual([-33.5, 50.08451, 50.08451],
+                         grid_centers.take(['19-10-10-11', '19-10-10-10', '19-10-10-10']).lat_deg.tolist())
+
+        with self.assertRaises(IndexError):
+            grid_centers.take(['19-10-10-12'])
+
+    def test_convert_yards_to_positions(self):
+        """
+        Should convert yards with the precomputed grid centers like with the grid center degrees
+        """
+        x = np.array([36.94333, 13.64571, -793.2684])
+        y = np.array([-258.8558, -248.5793, 93.98272])
+        references = ['19-10-10-10', '19-10-10-11', '19-10-10-10']
+
+        actual = convert_yards_to_positions(x, y, create_grid_centers(self.tact_scenario).take(references))
+        expect = convert_yards_to_degrees_array(x, y, np.array([50.08451, -33.5, 50.08451]),
+                                                np.array([-5.243314, 151.25, -5.243314]))
+
+        np.testing.assert_array_equal(expect, actual)
+
+    def test_get_distances(self):
+        """
+        Should get the distance between points like geopy, within a millimetre
+        """
+        lat1 = np.array([53.12345, -33.5, 0, 71.9, 10])
+        long1 = np.array([-8.12345, 151.25, 179.99, -179.99, 10])
+        lat2 = np.array([53.2, -34, 0.5, 71.9, 10])
+        long2 = np.array([-8.5, 152, -179.8, 179.5, 10])
+
+        actual = get_distances(lat1, long1, lat2, long2)
+
+        for i in range(len(lat1)):
+            with self.subTest(i=i):
+                expect = geodesic((lat1[i], long1[i]), (lat2[i], long2[i])).km
+                self.assertAlmostEqual(expect, actual[i], delta=1e-6)
+
+    def test_move_and_get_distances(self):
+        """
+        Should get the distance a point has been moved
+        """
+        lat, long = move_geo_points(np.array([53.12345]), np.array([-8.12345]), np.array([45]), np.array([12.5]))
+
+        self.assertAlmostEqual(12.5, get_distances(np.array([53.12345]), np.array([-8.12345]), lat, long)[0], places=9)
@@ -0,0 +1,95 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+import pandas as pd
+
+from src.importers.import_cache import ImportCache, hash_file, get_cache_path
+from src.importers.text_importer import TextImporter
+
+
+class ImportCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.cache = ImportCache(os.path.join(self.dir.name, 'cache'))
+        self.importer = TextImporter()
+        self.data = {'SONIC': pd.DataFrame({'DEPTH': [1.5, 2.5], 'REFERENCE': ['19-10-10-10', '19-10-10-10']})}
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def create_file(self, name: str, content: str) -> str:
+        path = os.path.join(self.dir.name, name)
+        with open(path, 'w') as f:
+            f.write(content)
+        return path
+
+    def test_hash_file(self):
+        """
+        Should only depend on the content of a file
+        """
+        path_1 = self.create_file('1.txt', 'EVENT NUMBER: 1')
+        path_2 = self.create_file('2.txt', 'EVENT NUMBER: 1')
+        path_3 = self.create_file('3.txt', 'EVENT NUMBER: 2')
+
+        self.assertEqual(hash_file(path_1), hash_file(path_2))
+        self.assertNotEqual(hash_file(path_1), hash_file(path_3))
+
+    def test_store_load(self):
+        """
+        Should load a stored import
+        """
+        path = self.create_file('1.txt', 'EVENT NUMBER: 1')
+
+        self.assertIsNone(self.cache.load(self.importer, path))
+
+        self.cache.store(self.importer, path, self.data)
+        actual = self.cache.load(self.importer, path)
+
+        pd.testing.assert_frame_equal(self.data['SONIC'], actual['SONIC'])
+        self.assertEqual([os.path.basename(self.cache.get_entry(self.importer, path))], os.listdir(self.cache.path))
+
+    def test_invalidate(self):
+        """
+        Should remove imports of a previous importer version
+        """
+        path = self.create_file('1.txt', 'EVENT NUMBER: 1')
+        self.cache.store(self.importer, path, self.data)
+
+        self.importer.version = '-1'
+        self.cache.invalidate(self.importer)
+        self.assertIsNone(self.cache.load(self.importer, path))
+
+        del self.importer.version
+        self.assertIsNone(self.cache.load(self.importer, path))
+
+    def test_evict(self):
+        """
+        Should remove the least recently used import when the cache is full
+        """
+        path_1 = self.create_file('1.txt', 'EVENT NUMBER: 1')
+        path_2 = self.create_file('2.txt', 'EVENT NUMBER: 2')
+
+        self.cache.store(self.importer, path_1, self.data)
+        entry_1 = self.cache.get_entry(self.importer, path_1)
+        self.cache.max_size = os.path.getsize(entry_1)
+
+        # make the first import the least recently used
+        os.utime(entry_1, (time.time() - 60, time.time() - 60))
+        self.cache.store(self.importer, path_2, self.data)
+
+        self.assertIsNone(self.cache.load(self.importer, path_1))
+        self.assertIsNotNone(self.cache.load(self.importer, path_2))
+
+    def test_get_cache_path(self):
+        """
+        Should use the directory of the environment variable, or else a per user cache directory
+        """
+        with mock.patch.dict(os.environ, {'MER_IO_CACHE': self.dir.name}):
+            self.assertEqual(self.dir.name, ImportCache().path)
+
+        with mock.patch.dict(os.environ, {'MER_IO_CACHE': '', 'LOCALAPPDATA': '', 'XDG_CACHE_HOME': self.dir.name}):
+            self.assertEqual(os.path.join(self.dir.name, 'mer.io', 'cache'), get_cache_path())
@@ -1,28 +1,78 @@
+import os
+import tempfile
 import unittest
-from io import StringIO
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from unittest import mock
 
 import pandas as pd
 
-from src.importers.text_importer import rename_duplicate_columns, transpose_df, import_file, set_reference
+from src.importers.text_importer import rename_duplicate_columns, set_reference, iter_tokens, TextImporter
+from src.importers.utility import assemble_events, split_zip_path, get_file_size
+from src.tasks import import_task
+from src.tasks.utility import get_txt_files_from_zip, create_executor
 
 import numpy as np
 
 
 class TextImporterTests(unittest.TestCase):
-    csv = StringIO("""
-        --
-        --
-        EVENT NUMBER: 1
-        1_COL1: VALUE1
-        1_COL2: VALUE2
-        --
-        --
-        EVENT NUMBER: 2
-        2_COL1: VALUE1
-        2_COL2: VALUE2
-        --
-        --
-        """)
+    mer = """--
+--
+EVENT NUMBER : 1
+EVENT HEADER - IDENTIFIER : TACTICAL_SCENARIO
+EVENT HEADER - TIME (YY) : 19
+EVENT HEADER - TIME (MM) : 10
+EVENT HEADER - TIME (DD) : 10
+EVENT HEADER - TIME (HH) : 10
+EVENT HEADER - TIME (MM) : 0
+EVENT HEADER - TIME (SS) : 0
+TACTICAL SCENARIO - GRID CENTER LAT : 5.208451e+001
+TACTICAL SCENARIO - GRID CENTER LONG : 4.243314e+000
+--
+--
+EVENT NUMBER : 2
+EVENT HEADER - IDENTIFIER : CONTACT
+EVENT HEADER - TIME (YY) : 19
+EVENT HEADER - TIME (MM) : 10
+EVENT HEADER - TIME (DD) : 10
+EVENT HEADER - TIME (HH) : 10
+EVENT HEADER - TIME (MM) : 0
+EVENT HEADER - TIME (SS) : 12
+CONTACT - BRG : 2.728674e+03
+CONTACT - RANGE :
+CONTACT - NAME : SUB
+CONTACT - CLASS : SHIP
+--
+--
+EVENT NUMBER : 3
+EVENT HEADER - IDENTIFIER : CONTACT
+EVENT HEADER - TIME (YY) : 19
+EVENT HEADER - TIME (MM) : 10
+EVENT HEADER - TIME (DD) : 10
+EVENT HEADER - TIME (HH) : 10
+EVENT HEADER - TIME (MM) : 0
+EVENT HEADER - TIME (SS) : 24
+CONTACT - BRG : UNKNOWN
+CONTACT - RANGE : 1.500000e+03
+CONTACT - NAME : 12
+CONTACT - CLASS : SHIP
+--
+--
+EVENT NUMBER : 4
+EVENT HEADER - IDENTIFIER : CONTACT
+EVENT HEADER - TIME (YY) : 19
+EVENT HEADER - TIME (MM) : 10
+EVENT HEADER - TIME (DD) : 10
+EVENT HEADER - TIME (HH) : 10
+EVENT HEADER - TIME (MM) : 0
+EVENT HEADER - TIME (SS) : 36
+CONTACT - BRG : 9.000000e+01
+CONTACT - RANGE :
+CONTACT - NAME : SUB
+CONTACT - CLASS : SHIP
+--
+--
+"""
 
     def test_clean_duplicate_columns(self):
         """
@@ -46,37 +96,139 @@ class TextImporterTests(unittest.TestCase):
 
         self.assertEqual(expect, actual)
 
-    def test_transpose_df(self):
+    def test_assemble_events(self):
         """
-        Should create a DF where every event is a row
+        Should create a DF for every identifier where every event is a row
         """
+        tokens = [('EVENT NUMBER', '1', '1'), ('EVENT HEADER - IDENTIFIER', 'ID1', '1'), ('COL1', 'VALUE1', '1'),
+                  ('EVENT NUMBER', '2', '2'), ('EVENT HEADER - IDENTIFIER', 'ID2', '2'), ('COL2', 'VALUE2', '2'),
+                  ('COL2', 'VALUE3', '2'),
+                  ('EVENT NUMBER', '3', '3'), ('EVENT HEADER - IDENTIFIER', 'ID1', '3'), ('COL3', 'VALUE4', '3')]
 
-        df = pd.DataFrame({
-            'NAME': ['COL1', 'COL2', 'COL3', 'COL1', 'COL2', 'COL3'],
-            'VALUE': ['VALUE1', 'VALUE2', 'VALUE3', 'VALUE1', 'VALUE2', 'VALUE3'],
-            'EVENT NUMBER': [1, 1, 1, 2, 2, 2]
-        })
+        actual = {key: df.values.tolist() for key, df in assemble_events(tokens).items()}
+        expect = {'ID1': [['1', 'ID1', 'VALUE1', np.nan],
+                          ['3', 'ID1', np.nan, 'VALUE4']],
+                  'ID2': [['2', 'ID2', 'VALUE2', 'VALUE3']]}
 
-        actual = transpose_df(df).values.tolist()
-        expect = [['COL1', 'COL2', 'COL3', np.nan, np.nan, np.nan],
-                  ['VALUE1', 'VALUE2', 'VALUE3', np.nan, np.nan, np.nan],
-                  [np.nan, np.nan, np.nan, 'COL1', 'COL2', 'COL3'],
-                  [np.nan, np.nan, np.nan, 'VALUE1', 'VALUE2', 'VALUE3']]
+        self.assertEqual(expect, actual)
+
+    def test_assemble_events_columns(self):
+        """
+        Should rename duplicate columns and only hold the columns of its own identifier
+        """
+        tokens = [('EVENT NUMBER', '1', '1'), ('EVENT HEADER - IDENTIFIER', 'ID1', '1'), ('COL1', 'VALUE1', '1'),
+                  ('EVENT NUMBER', '2', '2'), ('EVENT HEADER - IDENTIFIER', 'ID2', '2'), ('COL2', 'VALUE2', '2'),
+                  ('COL2', 'VALUE3', '2')]
+
+        actual = {key: list(df.columns) for key, df in assemble_events(tokens).items()}
+        expect = {'ID1': ['EVENT NUMBER', 'EVENT HEADER - IDENTIFIER', 'COL1'],
+                  'ID2': ['EVENT NUMBER', 'EVENT HEADER - IDENTIFIER', 'COL2', 'COL2.1']}
 
         self.assertEqual(expect, actual)
 
-    def test_import_file(self):
-        actual = import_file(self.csv).reset_index().values.tolist()
+    def create_mer(self, directory: str, name: str) -> str:
+        path = os.path.join(directory, name)
+        with open(path, 'w') as f:
+            f.write(self.mer)
+        return path
+
+    def test_import_text_file(self):
+        """
+        Should import a Mer text file into a DataFrame per identifier, every event is a row
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            identifiers = TextImporter().import_(self.create_mer(tmp, 'mer.txt'))
+
+        self.assertEqual(['TACTICAL_SCENARIO', 'CONTACT'], list(identifiers))
+        self.assertEqual([2.0, 3.0, 4.0], identifiers['CONTACT']['EVENT NUMBER'].tolist())
+        self.assertEqual(['19-10-10-10'] * 3, identifiers['CONTACT']['REFERENCE'].tolist())
+        self.assertEqual(pd.Timestamp('2019-10-10 10:00:24'), identifiers['CONTACT']['TIME_'][1])
 
-        expect = [['EVENT NUMBER', '1', 1],
-                  ['1_COL1', 'VALUE1', 1],
-                  ['1_COL2', 'VALUE2', 1],
-                  ['EVENT NUMBER', '2', 2],
-                  ['2_COL1', 'VALUE1', 2],
-                  ['2_COL2', 'VALUE2', 2]]
+    def test_iter_tokens(self):
+        """
+        Should split on the first colon, drop separators and trace back every line to an event number
+        """
+        lines = ['--', 'EVENT NUMBER : 7', 'COL1 : 10:15', 'COL2 :', '', '--', 'EVENT NUMBER: 8', 'COL1: VALUE1']
+
+        actual = list(iter_tokens(lines))
+        expect = [('EVENT NUMBER', '7', '7'), ('COL1', '10:15', '7'), ('COL2', np.nan, '7'),
+                  ('EVENT NUMBER', '8', '8'), ('COL1', 'VALUE1', '8')]
 
         self.assertEqual(expect, actual)
 
+    def test_iter_tokens_without_colon(self):
+        """
+        Should give a line without a colon a missing value, like read_csv did
+        """
+        actual = list(iter_tokens(['EVENT NUMBER: 1', 'COL1', 'COL2: VALUE2']))
+
+        self.assertEqual(['EVENT NUMBER', 'COL1', 'COL2'], [name for name, _, _ in actual])
+        self.assertTrue(np.isnan(actual[1][1]))
+        self.assertEqual(['1', '1', '1'], [event_number for _, _, event_number in actual])
+
+    def test_import_file_from_zip(self):
+        """
+        Should read a .txt file straight from a zip archive
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'mer.zip')
+            with zipfile.ZipFile(path, 'w') as zip_ref:
+                zip_ref.writestr('mers/mer.txt', self.mer)
+                zip_ref.writestr('readme.md', '')
+
+            txt_files = get_txt_files_from_zip(path)
+            self.assertEqual([path + '/mers/mer.txt'], txt_files)
+            self.assertEqual((path, 'mers/mer.txt'), split_zip_path(txt_files[0]))
+            self.assertEqual(len(self.mer.encode()), get_file_size(txt_files[0]))
+
+            actual = TextImporter().import_(txt_files[0])
+            expect = TextImporter().import_(self.create_mer(tmp, 'mer.txt'))
+
+        self.assertEqual(list(expect), list(actual))
+        for key in expect:
+            pd.testing.assert_frame_equal(expect[key], actual[key])
+
+    def test_text_importer_scientific_columns(self):
+        """
+        Should only make the columns in which at least half of the non blank values are numbers scientific
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'mer.txt')
+            with open(path, 'w') as f:
+                # a Mer writes a space after the colon of an empty value
+                f.write(self.mer.replace(':\n', ': \n'))
+
+            identifiers = TextImporter().import_(path)
+
+        actual = {key: list(df.select_dtypes(include=np.number).columns) for key, df in identifiers.items()}
+        expect = {'TACTICAL_SCENARIO': ['EVENT NUMBER', 'TACTICAL SCENARIO - GRID CENTER LAT',
+                                        'TACTICAL SCENARIO - GRID CENTER LONG'],
+                  'CONTACT': ['EVENT NUMBER', 'CONTACT - BRG', 'CONTACT - RANGE']}
+
+        self.assertEqual(expect, actual)
+        self.assertEqual([2728.674, 90.0], identifiers['CONTACT']['CONTACT - BRG'].dropna().tolist())
+        self.assertEqual([1500.0], identifiers['CONTACT']['CONTACT - RANGE'].dropna().tolist())
+        self.assertEqual(['SUB', '12', 'SUB'], identifiers['CONTACT']['CONTACT - NAME'].tolist())
+
+    def test_import_file_workers(self):
+        """
+        Should import files in worker processes like the importer itself
+        """
+        with tempfile.TemporaryDirectory() as tmp, mock.patch.dict(os.environ, {'MER_IO_CACHE': tmp}), \
+                mock.patch('os.cpu_count', return_value=2):
+            paths = [self.create_mer(tmp, '1.txt'), self.create_mer(tmp, '2.txt')]
+
+            with create_executor(len(paths)) as executor:
+                self.assertIsInstance(executor, ProcessPoolExecutor)
+                actual = [f.result() for f in [executor.submit(import_task.import_file, 'txt', path) for path in paths]]
+
+            expect = TextImporter().import_(paths[0])
+
+        for data in actual:
+            self.assertEqual(list(expect), list(data))
+            for key in expect:
+                pd.testing.assert_frame_equal(expect[key], data[key])
+
     def test_set_reference_single(self):
         cols = ['EVENT HEADER - TIME (YY)', 'EVENT HEADER - TIME (MM)',
                 'EVENT HEADER - TIME (DD)', 'EVENT HEADER - TIME (HH)']
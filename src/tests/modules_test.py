@@ -1,10 +1,21 @@
+import datetime
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 import unittest
+from unittest import mock
 import pandas as pd
 import numpy as np
+from PyQt5.QtCore import Qt
 
-from src.importers.text_importer import rename_duplicate_columns, clean_datetime_columns, clean_scientific_columns
+from src.importers.text_importer import rename_duplicate_columns, clean_datetime_columns, clean_scientific_columns, \
+    infer_numeric_columns
+from src.exceptions import FilterCancelledException
 from src.models.dataframe_model import DataFrameModel
-from src.tasks.utility import create_mer_data
+from src.models.utility import format_value, format_column, split_datetime_columns, format_frame
+from src.converters.geodesy import create_grid_centers
+from src.tasks.convert_task import converters, ConvertTask, init_worker, convert_identifier
+from src.tasks.filter_task import FilterTask
+from src.tasks.import_task import set_reference
+from src.tasks.utility import create_mer_data, create_executor, merge_frames, convert_frame, get_display_formats
 
 
 class ImportModuleTests(unittest.TestCase):
@@ -12,17 +23,166 @@ class ImportModuleTests(unittest.TestCase):
         """
         Should correctly create a separate dataframe for every unique identifier type
         """
-        df = pd.DataFrame({'EVENT HEADER - IDENTIFIER': ['SCENARIO_1', 'SCENARIO_2', 'SCENARIO_3'],
-                           'TEST_COL_1': ['TEST_VALUE_1', 'TEST_VALUE_2', 'TEST_VALUE_3'],
-                           'TEST_COL_2': ['TEST_VALUE_1', 'TEST_VALUE_2', 'TEST_VALUE_3']})
+        identifiers = {key: pd.DataFrame({'EVENT HEADER - IDENTIFIER': [key],
+                                          'TEST_COL_1': ['TEST_VALUE_1'],
+                                          'TEST_COL_2': ['TEST_VALUE_2']})
+                       for key in ['SCENARIO_2', 'SCENARIO_1', 'SCENARIO_3']}
 
-        df_dict = create_mer_data(df)
+        df_dict = create_mer_data(identifiers)
 
         self.assertEqual(list(df_dict.keys()), ['SCENARIO_1', 'SCENARIO_2', 'SCENARIO_3'])
         for key, value in df_dict.items():
             with self.subTest(key=key):
                 self.assertEqual(DataFrameModel, type(value))
 
+    def test_merge_frames(self):
+        """
+        Should merge the events of multiple Mers in order of time, events at the same time keep the order of import
+        """
+        def create_df(name, times):
+            return pd.DataFrame({'TIME_': pd.to_datetime(times), 'NAME': name})
+
+        dfs = [create_df('a', ['2021-01-01 10:00', '2021-01-01 10:02', '2021-01-01 10:04']),
+               create_df('b', ['2021-01-01 10:01', '2021-01-01 10:02']),
+               create_df('c', ['2021-01-01 09:00', '2021-01-01 09:30']),
+               create_df('d', ['2021-01-01 10:03', pd.NaT, '2021-01-01 09:15'])]
+
+        df = merge_frames(dfs, 'TIME_')
+
+        self.assertEqual(['c', 'd', 'c', 'a', 'b', 'a', 'b', 'd', 'a', 'd'], df['NAME'].tolist())
+        self.assertEqual(list(range(10)), df.index.tolist())
+        self.assertTrue(pd.isna(df['TIME_'].iloc[-1]))
+
+    def test_set_reference_tactical_scenario(self):
+        """
+        Should give Mers without a tactical scenario the tactical scenario of the previous hour
+        """
+        def create_import(reference, tactical_scenario):
+            data = {'CONTACT': pd.DataFrame({'REFERENCE': [reference]})}
+            if tactical_scenario:
+                data['TACTICAL_SCENARIO'] = pd.DataFrame({'GRID CENTER LAT': [52.0], 'REFERENCE': [reference]})
+            return data
+
+        imports = set_reference([create_import('19-10-10-10', True),
+                                 create_import('19-10-10-11', False),
+                                 create_import('19-10-10-12', False),
+                                 create_import('19-10-10-14', False)])
+
+        self.assertEqual(['19-10-10-10', '19-10-10-11', '19-10-10-12'],
+                         [data['TACTICAL_SCENARIO']['REFERENCE'][0] for data in imports[:3]])
+        self.assertEqual([52.0, 52.0], [data['TACTICAL_SCENARIO']['GRID CENTER LAT'][0] for data in imports[1:3]])
+        self.assertNotIn('TACTICAL_SCENARIO', imports[3])
+        self.assertEqual('19-10-10-10', imports[0]['TACTICAL_SCENARIO']['REFERENCE'][0])
+
+    def test_convert_frame(self):
+        """
+        Should only run the converters which convert columns of the DataFrame, on those columns
+        """
+        df = pd.DataFrame({'COURSE': [90.4], 'POS X': [36.94333], 'POS Y': [-258.8558], 'NAME': ['A'],
+                           'REFERENCE': ['19-10-10-10']})
+        tact_scenario = pd.DataFrame({'GRID CENTER LAT': [50.08451], 'GRID CENTER LONG': [-5.243314],
+                                      'REFERENCE': ['19-10-10-10']})
+
+        plan = convert_frame(df, 'CONTACT', converters, tact_scenario=tact_scenario)
+
+        self.assertEqual([('DegreesConverter', ['COURSE']),
+                          ('YardsToCoordinatesConverter', ['POS X', 'POS Y', 'REFERENCE']),
+                          ('ReferenceConverter', ['REFERENCE'])],
+                         [(step.converter, step.columns) for step in plan])
+        self.assertEqual({'COURSE': 'degrees', 'POS X': 'latitude', 'POS Y': 'longitude'},
+                         get_display_formats(df, plan))
+        self.assertEqual([['090', 'N 50° 04\' 57"', 'W 005° 14\' 34"', 'A']],
+                         format_frame(df, get_display_formats(df, plan)).values.tolist())
+
+    def test_convert_task(self):
+        """
+        Should convert every identifier and merge the results back into the MerData
+        """
+        tact_scenario = pd.DataFrame({'GRID CENTER LAT': [50.08451], 'GRID CENTER LONG': [-5.243314],
+                                      'REFERENCE': ['19-10-10-10']})
+        mer_data = {'CONTACT': DataFrameModel(pd.DataFrame({'COURSE': [90.4, 180.0], 'REFERENCE': ['19-10-10-10'] * 2}),
+                                              'CONTACT'),
+                    'TACTICAL_SCENARIO': DataFrameModel(tact_scenario, 'TACTICAL_SCENARIO')}
+        result = dict()
+
+        task = ConvertTask(mer_data)
+        task.task_finished.connect(result.update)
+        task.convert()
+
+        contact, tact_scenario = result['CONTACT'], result['TACTICAL_SCENARIO']
+
+        self.assertEqual([90.0, 180.0], contact.original_df['COURSE'].tolist())
+        self.assertEqual(['090', '180'], format_column('COURSE', contact.df['COURSE'], contact.formats['COURSE']).tolist())
+        self.assertEqual('N 50° 05\' 04"', format_value('GRID CENTER LAT', tact_scenario.df['GRID CENTER LAT'][0],
+                                                        tact_scenario.formats['GRID CENTER LAT']))
+        self.assertEqual({'CONTACT', 'TACTICAL_SCENARIO'}, {step.identifier for step in task.plan})
+
+    def test_convert_task_durations(self):
+        """
+        Should keep the durations of sonobuoys native, show them as text and filter them on their values
+        """
+        sonobuoy = pd.DataFrame({'LIFE TIME': [59.7, 5400, np.nan], 'REMAINING TIME': [1000, 3599999, 61000],
+                                 'REFERENCE': ['19-10-10-10'] * 3})
+        tact_scenario = pd.DataFrame({'GRID CENTER LAT': [50.08451], 'GRID CENTER LONG': [-5.243314],
+                                      'REFERENCE': ['19-10-10-10']})
+        mer_data = {'SONOBUOY': DataFrameModel(sonobuoy, 'SONOBUOY'),
+                    'TACTICAL_SCENARIO': DataFrameModel(tact_scenario, 'TACTICAL_SCENARIO')}
+        result = dict()
+
+        task = ConvertTask(mer_data)
+        task.task_finished.connect(result.update)
+        task.convert()
+
+        dfm = result['SONOBUOY']
+        dfm.init_filters()
+
+        self.assertEqual(pd.Timedelta(minutes=90), dfm.original_df['LIFE TIME'][1])
+        self.assertEqual([['00:01:00', '00:00:01'], ['01:30:00', '01:00:00'], ['', '00:01:01']],
+                         format_frame(dfm.df, dfm.formats)[['LIFE TIME', 'REMAINING TIME']].values.tolist())
+        self.assertEqual([1], np.flatnonzero(dfm.get_filter_mask('LIFE TIME', '>00:30:00')).tolist())
+        self.assertEqual([0, 2], np.flatnonzero(dfm.get_filter_mask('REMAINING TIME', '00:00:01..00:01:01')).tolist())
+
+    def test_convert_identifier_workers(self):
+        """
+        Should convert identifiers in worker processes like convert_frame
+        """
+        tact_scenario = pd.DataFrame({'GRID CENTER LAT': [50.08451], 'GRID CENTER LONG': [-5.243314],
+                                      'REFERENCE': ['19-10-10-10']})
+        frames = {'CONTACT': pd.DataFrame({'COURSE': [90.4], 'POS X': [36.94333], 'POS Y': [-258.8558],
+                                           'REFERENCE': ['19-10-10-10']}),
+                  'SONIC': pd.DataFrame({'BRG': [180.2, 359.6], 'REFERENCE': ['19-10-10-10'] * 2})}
+        grid_centers = create_grid_centers(tact_scenario)
+
+        with mock.patch('os.cpu_count', return_value=2):
+            with create_executor(len(frames), initializer=init_worker,
+                                 initargs=(converters, tact_scenario, grid_centers)) as executor:
+                self.assertIsInstance(executor, ProcessPoolExecutor)
+                futures = {name: executor.submit(convert_identifier, name, df) for name, df in frames.items()}
+                actual = {name: future.result() for name, future in futures.items()}
+
+        for name, df in frames.items():
+            with self.subTest(name=name):
+                plan = convert_frame(df, name, converters, tact_scenario=tact_scenario, grid_centers=grid_centers)
+                pd.testing.assert_frame_equal(df, actual[name][0])
+                self.assertEqual(plan, actual[name][1])
+
+    def test_create_executor(self):
+        """
+        Should not start worker processes for a single task or little work and keep results in order for multiple tasks
+        """
+        with mock.patch('os.cpu_count', return_value=4):
+            with create_executor(1) as executor:
+                self.assertIsInstance(executor, ThreadPoolExecutor)
+
+            with create_executor(4, work_size=10, min_work_size=100) as executor:
+                self.assertIsInstance(executor, ThreadPoolExecutor)
+
+            with create_executor(4) as executor:
+                self.assertIsInstance(executor, ProcessPoolExecutor)
+                actual = [f.result() for f in [executor.submit(abs, x) for x in [-3, -2, -1, 0]]]
+
+        self.assertEqual([3, 2, 1, 0], actual)
+
     def test_clean_datetime_columns(self):
         df = pd.DataFrame(
             np.array([['19', '10', '10', '10', '10', '10']]),
@@ -37,6 +197,145 @@ class ImportModuleTests(unittest.TestCase):
         df = clean_datetime_columns(df)
 
         self.assertEqual(['DATE_', 'TIME_'], list(df.columns))
+        self.assertEqual(pd.Timestamp(2019, 10, 10), df['DATE_'][0])
+        self.assertEqual(pd.Timestamp(2019, 10, 10, 10, 10, 10), df['TIME_'][0])
+
+    def test_format_datetime_columns(self):
+        """
+        Should show the date of DATE_ and the time of day of all other timestamps
+        """
+        df = pd.DataFrame({
+            'DATE_': [pd.Timestamp(2019, 10, 10)],
+            'TIME_': [pd.Timestamp(2019, 10, 10, 10, 15, 2)],
+            'RANGE': [1.5]
+        })
+
+        self.assertEqual(['2019-10-10', '10:15:02', '1.5'], [format_value(name, df[name][0]) for name in df.columns])
+        self.assertEqual(['10:15:02'], format_column('TIME_', df['TIME_']).tolist())
+
+        exported = split_datetime_columns(df)
+        self.assertEqual([datetime.date(2019, 10, 10), datetime.time(10, 15, 2), 1.5], exported.iloc[0].tolist())
+
+    def test_format_display_columns(self):
+        """
+        Should show converted values in their display format, values which can not be formatted stay empty on export
+        """
+        df = pd.DataFrame({'COURSE': [45.0, np.nan], 'LAT': [52.5, np.nan]})
+        formats = {'COURSE': 'degrees', 'LAT': 'latitude'}
+
+        self.assertEqual(['045', 'nan'], [format_value('COURSE', value, formats['COURSE']) for value in df['COURSE']])
+        self.assertEqual(['N 52° 30\' 00"', 'nan'], format_column('LAT', df['LAT'], formats['LAT']).tolist())
+
+        exported = format_frame(df, formats)
+        self.assertEqual(['045', 'N 52° 30\' 00"'], exported.iloc[0].tolist())
+        self.assertTrue(exported.iloc[1].isna().all())
+
+    def test_apply_filters(self):
+        """
+        Should filter rows on the lowercase text shown for every column, until the DataFrame is replaced
+        """
+        dfm = DataFrameModel(pd.DataFrame({'ID - NAME': ['Alpha', 'beta', 'Gamma'], 'ID - COURSE': [45.0, 145.0, 90.0]}))
+        dfm.formats = {'COURSE': 'degrees'}
+        dfm.init_filters()
+
+        dfm.set_filter('NAME', 'A')
+        dfm.set_filter('COURSE', '^0')
+        dfm.apply_filters()
+        self.assertEqual(['Alpha', 'Gamma'], dfm.df['NAME'].tolist())
+
+        dfm.set_filter('NAME', 'ph.')
+        dfm.apply_filters()
+        self.assertEqual(['Alpha'], dfm.df['NAME'].tolist())
+
+        dfm.original_df = pd.DataFrame({'NAME': ['Delta', 'Alphabet'], 'COURSE': [5.0, 200.0]})
+        dfm.apply_filters()
+        self.assertEqual([], dfm.df['NAME'].tolist())
+
+        dfm.set_filter('COURSE', '', False)
+        dfm.apply_filters()
+        self.assertEqual(['Alphabet'], dfm.df['NAME'].tolist())
+
+    def test_filter_masks(self):
+        """
+        Should keep the mask of every filter and only search the rows of the previous mask when an expression is extended
+        """
+        dfm = DataFrameModel(pd.DataFrame({'NAME': ['Alpha', 'alphabet', 'Beta'], 'COURSE': [45.0, 145.0, 90.0]}))
+        dfm.init_filters()
+
+        dfm.set_filter('NAME', 'al')
+        dfm.apply_filters()
+        self.assertEqual(['Alpha', 'alphabet'], dfm.df['NAME'].tolist())
+
+        # the row which did not pass the previous mask is not searched again
+        dfm.get_lower_column('NAME')[2] = 'alpha'
+        dfm.set_filter('NAME', 'alpha')
+        dfm.apply_filters()
+        self.assertEqual(['Alpha', 'alphabet'], dfm.df['NAME'].tolist())
+
+        dfm.set_filter('NAME', 'alpha|b')
+        dfm.apply_filters()
+        self.assertEqual(['Alpha', 'alphabet', 'Beta'], dfm.df['NAME'].tolist())
+
+        # toggling a column does not filter the rows again
+        dfm.get_lower_column('NAME')[2] = 'gamma'
+        dfm.set_column('COURSE', Qt.Unchecked)
+        self.assertEqual(['NAME'], list(dfm.df.columns))
+        self.assertEqual(['Alpha', 'alphabet', 'Beta'], dfm.df['NAME'].tolist())
+
+    def test_range_filters(self):
+        """
+        Should filter numeric and time columns on their values, other expressions are searched as text
+        """
+        dfm = DataFrameModel(pd.DataFrame({
+            'RANGE': [1.5, 2.0, np.nan, 5.0, 7.25],
+            'TIME_': pd.to_datetime(['2019-10-10 09:59:59', '2019-10-10 10:00:00', '2019-10-11 10:07:30', pd.NaT,
+                                     '2019-10-10 10:15:01']),
+            'NAME': ['a..b', 'b', 'c', 'd', 'e']
+        }))
+        dfm.init_filters()
+
+        for name, expr, expect in [('RANGE', '2..5', [1, 3]), ('RANGE', '>2', [3, 4]), ('RANGE', '<=2', [0, 1]),
+                                   ('RANGE', '=7.25', [4]), ('RANGE', '5..', [3, 4]), ('RANGE', '7', [4]),
+                                   ('TIME_', '10:00..10:15', [1, 2]), ('TIME_', '<10:00', [0]),
+                                   ('NAME', 'a..b', [0]), ('RANGE', '>', [])]:
+            with self.subTest(name=name, expr=expr):
+                self.assertEqual(expect, np.flatnonzero(dfm.get_filter_mask(name, expr)).tolist())
+
+    def test_get_position(self):
+        """
+        Should find a cell of the unfiltered DataFrame in the filtered DataFrame, unless it is hidden
+        """
+        dfm = DataFrameModel(pd.DataFrame({'NAME': ['Alpha', 'Beta', 'alphabet'], 'COURSE': [45.0, 145.0, 90.0]}))
+        dfm.init_filters()
+
+        dfm.set_filter('NAME', 'alpha')
+        dfm.apply_filters()
+        dfm.set_column('NAME', Qt.Unchecked)
+
+        self.assertEqual((1, 0), dfm.get_position(2, 'COURSE'))
+        self.assertIsNone(dfm.get_position(1, 'COURSE'))
+        self.assertIsNone(dfm.get_position(2, 'NAME'))
+
+    def test_filter_task(self):
+        """
+        Should only publish the rows of the latest filter evaluation
+        """
+        dfm = DataFrameModel(pd.DataFrame({'NAME': ['Alpha', 'alphabet', 'Beta'] * 10000}))
+        dfm.init_filters()
+
+        dfm.set_filter('NAME', 'alpha')
+        stale = FilterTask(dfm)
+        dfm.set_filter('NAME', 'beta')
+        latest = FilterTask(dfm)
+
+        with self.assertRaises(FilterCancelledException):
+            dfm.get_row_mask(stale.filters, stale.is_cancelled)
+
+        stale.run()
+        self.assertEqual(30000, len(dfm.df))
+
+        latest.run()
+        self.assertEqual(['Beta'] * 10000, dfm.df['NAME'].tolist())
 
     def test_clean_scientific_columns(self):
         df = pd.DataFrame({
@@ -56,3 +355,43 @@ class ImportModuleTests(unittest.TestCase):
         expect = [[13.64571, -248.5793, 'test', 'test']]
 
         self.assertEqual(actual, expect)
+
+    def test_infer_numeric_columns(self):
+        """
+        Should only pick columns in which most of the values are numbers
+        """
+        df = pd.DataFrame({
+            'col1': ['1.364571e+001', '19', np.nan],
+            'col2': ['-2.485793e+002', 'N/A', '3'],
+            'col3': ['test', '1', 'test'],
+            'col4': [np.nan, np.nan, np.nan]
+        })
+
+        actual = {key: value.tolist() for key, value in infer_numeric_columns(df).items()}
+
+        self.assertEqual(['col1', 'col2'], list(actual.keys()))
+        self.assertEqual([13.64571, 19.0], actual['col1'][:2])
+        self.assertEqual([-248.5793, 3.0], [actual['col2'][0], actual['col2'][2]])
+
+    def test_infer_numeric_columns_blank(self):
+        """
+        Should leave blank values out and make them NaN in a numeric column
+        """
+        df = pd.DataFrame({'col1': ['', '1.5e+03', ' ', ''], 'col2': ['', 'test', 'test', '1']})
+
+        actual = infer_numeric_columns(df)
+
+        self.assertEqual(['col1'], list(actual.keys()))
+        self.assertEqual([1500.0], actual['col1'].dropna().tolist())
+        self.assertEqual(1, actual['col1'].notna().sum())
+
+    def test_infer_numeric_columns_sampled(self):
+        """
+        Should judge long columns on a sample but convert the whole column
+        """
+        df = pd.DataFrame({'col1': ['1'] * 99 + ['test'], 'col2': ['test'] * 99 + ['1']})
+
+        actual = infer_numeric_columns(df, sample_size=10)
+
+        self.assertEqual(['col1'], list(actual.keys()))
+        self.assertEqual(99, actual['col1'].notna().sum())
@@ -0,0 +1,51 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.dataclasses.search_hit import SearchHit
+from src.models.dataframe_model import DataFrameModel
+from src.models.search_index import create_search_index, get_trigram_index
+
+
+class SearchIndexTests(unittest.TestCase):
+
+    def setUp(self) -> None:
+        contact = DataFrameModel(pd.DataFrame({'COURSE': [90.0, 180.0, np.nan], 'TYPE': ['Buoy 12', 'buoy 3', 'SHIP']}),
+                                 'CONTACT')
+        contact.formats = {'COURSE': 'degrees'}
+
+        sonic = DataFrameModel(pd.DataFrame({'EVENT TYPE': ['SONIC_PINGING', 'BUOY_12_ON']}), 'SONIC')
+
+        self.search_index = create_search_index({'CONTACT': contact, 'SONIC': sonic,
+                                                 'EMPTY': DataFrameModel(pd.DataFrame({'A': []}), 'EMPTY')})
+
+    def test_search(self):
+        """
+        Should find the cells of all identifiers which show a text, case insensitive
+        """
+        expect = [SearchHit('CONTACT', 0, 'TYPE', 'Buoy 12'), SearchHit('SONIC', 1, 'EVENT TYPE', 'BUOY_12_ON')]
+
+        self.assertEqual((expect, 2), self.search_index.search('12'))
+        self.assertEqual(([SearchHit('CONTACT', 0, 'COURSE', '090')], 1), self.search_index.search('090'))
+        self.assertEqual(([SearchHit('CONTACT', 1, 'TYPE', 'buoy 3')], 1), self.search_index.search('BUOY 3'))
+        self.assertEqual(([], 0), self.search_index.search('buoy 4'))
+        self.assertEqual(([], 0), self.search_index.search(''))
+
+    def test_search_limit(self):
+        """
+        Should return the first hits by identifier, column and row, and count all hits
+        """
+        hits, total = self.search_index.search('o', limit=2)
+
+        self.assertEqual(4, total)
+        self.assertEqual([('CONTACT', 0, 'TYPE'), ('CONTACT', 1, 'TYPE')],
+                         [(hit.identifier, hit.row, hit.column) for hit in hits])
+
+    def test_get_trigram_index(self):
+        """
+        Should list every text which contains a trigram once
+        """
+        actual = get_trigram_index(np.array(['aaaa', 'baaa', 'ab'], dtype=object))
+
+        self.assertEqual({'aaa': [0, 1], 'baa': [1]}, {key: value.tolist() for key, value in actual.items()})
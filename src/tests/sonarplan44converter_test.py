@@ -1,7 +1,13 @@
 import unittest
 
-from src.converters.sonarplan_converter import get_dip_cols, convert_sonar_plan_44, move_geo_point, get_dip_points, \
-    SonarPlanConverter
+import geopy
+from geopy.distance import geodesic
+
+from src.converters.sonarplan_converter import get_dip_cols, convert_sonar_plan_44, get_dip_points, \
+    SonarPlanConverter, get_dip_layout
+from src.converters.geodesy import move_geo_points
+from src.converters.utility import convert_dist
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
 
@@ -48,10 +54,11 @@ class SonarPlanConverterTests(unittest.TestCase):
         Should correctly move geo point
         """
 
-        actual = move_geo_point(53.12345, -8.12345, 180, 1.5)
-        expect = (53.098487829300794, -8.12345)
+        lat, long = move_geo_points(np.array([53.12345]), np.array([-8.12345]), np.array([180]),
+                                    convert_dist(np.array([1.5]), 'nm', 'km'))
 
-        self.assertEqual(expect, actual)
+        self.assertAlmostEqual(53.098487829300794, lat[0], delta=1e-8)
+        self.assertAlmostEqual(-8.12345, long[0], delta=1e-8)
 
     def test_get_dip_cols(self):
         """
@@ -75,3 +82,32 @@ class SonarPlanConverterTests(unittest.TestCase):
         expect = [[53.12345, -8.12345, 53.14009, -8.12345, 53.12344, -8.08195, 53.10681, -8.12345, 53.12344, -8.16495]]
 
         self.assertEqual(expect, actual)
+
+    def test_move_geo_points(self):
+        """
+        Should move arrays of geo points like geopy, within a millimetre (1e-8 degrees)
+        """
+        lat = np.array([53.12345, -33.5, 0, 71.9, -89.5])
+        long = np.array([-8.12345, 151.25, 179.99, -179.99, 10])
+        bearing = np.array([180, 45, 90, 270, 353])
+        nm = np.array([1.5, 4, 8, 2.5, 3.5])
+
+        actual_lat, actual_long = move_geo_points(lat, long, bearing, convert_dist(nm, 'nm', 'km'))
+
+        for i in range(len(lat)):
+            with self.subTest(lat=lat[i], long=long[i]):
+                expect = geodesic(kilometers=convert_dist(nm[i], 'nm', 'km')).destination(
+                    geopy.Point(lat[i], long[i]), bearing[i])
+                self.assertAlmostEqual(expect.latitude, actual_lat[i], delta=1e-8)
+                self.assertAlmostEqual(expect.longitude, actual_long[i], delta=1e-8)
+
+    def test_get_dip_layout(self):
+        """
+        Should get the bearing and distance of every dip of every heli
+        """
+        actual = [(lat, long, bearing, round(km, 3))
+                  for lat, long, bearing, km in get_dip_layout(list(self.df.columns), get_dip_cols(self.df.columns))]
+        expect = [('DIP POINT 1 X', 'DIP POINT 1 Y', 0, 1.852), ('DIP POINT 2 X', 'DIP POINT 2 Y', 90, 2.778),
+                  ('COOP DIP 1 X', 'COOP DIP 1 Y', 180, 1.852), ('COOP DIP 2 X', 'COOP DIP 2 Y', 270, 2.778)]
+
+        self.assertEqual(expect, actual)
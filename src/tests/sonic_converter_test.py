@@ -0,0 +1,52 @@
+import unittest
+import pandas as pd
+from src.converters.sonic_converter import convert_sonic_cols, get_ping_sessions, SonicConverter
+
+
+class SonicConverterTests(unittest.TestCase):
+
+    df: pd.DataFrame = pd.DataFrame({
+        'TIME_': pd.to_datetime(['2021-01-01 10:00:00', '2021-01-01 10:01:00', '2021-01-01 10:02:00',
+                                 '2021-01-01 10:05:30', '2021-01-01 10:06:00', '2021-01-01 10:07:00',
+                                 '2021-01-01 10:08:00', '2021-01-01 10:09:00']),
+        'EVENT TYPE': ['SONIC_PINGING', 'SONIC_PINGING', 'OTHER', 'SONIC_PINGING',
+                       'SONIC_PINGING', 'SONIC_PINGING', 'SONIC_PINGING', 'SONIC_PINGING'],
+        'PING ON/OFF STAT': ['OFF', 'ON', 'OFF', 'ON', 'OFF', 'OFF', 'ON', 'ON']
+    })
+
+    tact_scenario = pd.DataFrame({
+        'GRID CENTER LAT': [52.0],
+        'GRID CENTER LONG': [4.0],
+        'REFERENCE': [1]
+    })
+
+    def test_get_ping_sessions(self):
+        """
+        Should pair the first ping ON with the first ping OFF after it, other ON/OFF events are ignored
+        """
+        start, end = get_ping_sessions(self.df)
+
+        self.assertEqual([1, 6], start.dropna().index.tolist())
+        self.assertEqual([pd.Timestamp('2021-01-01 10:01:00'), pd.Timestamp('2021-01-01 10:08:00')],
+                         start.dropna().tolist())
+        self.assertEqual([pd.Timestamp('2021-01-01 10:06:00')], end.dropna().tolist())
+        self.assertEqual(1, end.dropna().index[0])
+
+    def test_convert_sonic_cols(self):
+        """
+        Should set the duration of every ping session
+        """
+        actual = convert_sonic_cols(self.df, self.tact_scenario)
+
+        self.assertEqual('00:05:00', actual['DURATION'][1])
+        self.assertEqual(1, actual['DURATION'].notna().sum())
+        self.assertEqual([52.0, 4.0], actual[['LATITUDE', 'LONGITUDE']].iloc[0].tolist())
+
+    def test_converter(self):
+        """
+        Should only convert SONIC
+        """
+        converter = SonicConverter()
+
+        self.assertNotIn('DURATION', converter.convert(self.df, name='OTHER', tact_scenario=self.tact_scenario))
+        self.assertIn('DURATION', converter.convert(self.df, name='SONIC', tact_scenario=self.tact_scenario))
@@ -0,0 +1,53 @@
+import unittest
+import numpy as np
+import pandas as pd
+from src.converters.time_converter import convert_sbuoy_time_cols, TimeConverter
+from src.converters.utility import DURATION
+from src.models.utility import format_frame
+
+
+class TimeConverterTests(unittest.TestCase):
+
+    df = pd.DataFrame({
+        'LIFE TIME': [0, 59.7, 2.5, 5400, 86399.5, 90000, 864000, -3600, np.nan],
+        'REMAINING TIME': [1000, 1500, 59700, 3599999, 0, np.nan, 7200000, 60000, 61000]
+    })
+
+    def test_convert_sbuoy_time_cols(self):
+        """
+        Should convert the life time (seconds) and remaining time (milliseconds) of sonobuoys to durations
+        """
+        expect = {
+            'LIFE TIME': ['00:00:00', '00:01:00', '00:00:03', '01:30:00', '00:00:00', '01:00:00', ' 00:00:00',
+                          ' +23:00:00', ''],
+            'REMAINING TIME': ['00:00:01', '00:00:02', '00:01:00', '01:00:00', '00:00:00', '', '02:00:00', '00:01:00',
+                               '00:01:01']
+        }
+
+        actual = convert_sbuoy_time_cols(self.df)
+
+        self.assertEqual(expect, {col: actual[col].tolist() for col in actual.columns})
+
+    def test_convert_sbuoy_time_cols_native(self):
+        """
+        Should keep the durations native and show them like the converted text
+        """
+        converter = TimeConverter(native_durations=True)
+
+        actual = converter.convert(self.df, name='SONOBUOY', scientific_cols=list(self.df.columns))
+        formats = converter.get_formats('SONOBUOY', list(self.df.columns), list(self.df.columns))
+
+        self.assertEqual({'LIFE TIME': DURATION, 'REMAINING TIME': DURATION}, formats)
+        self.assertTrue(all(pd.api.types.is_timedelta64_dtype(actual[col]) for col in actual.columns))
+        self.assertEqual(pd.Timedelta(minutes=90), actual['LIFE TIME'][3])
+        pd.testing.assert_frame_equal(convert_sbuoy_time_cols(self.df), format_frame(actual, formats))
+
+    def test_convert_sbuoy_time_cols_negative(self):
+        """
+        Should not convert the sonobuoys when a negative duration is not a whole number of hours
+        """
+        df = pd.DataFrame({'LIFE TIME': [10, -90], 'REMAINING TIME': [1000, 1000]})
+
+        actual = TimeConverter().convert(df, name='SONOBUOY', scientific_cols=list(df.columns))
+
+        self.assertIs(df, actual)
@@ -2,8 +2,11 @@ import unittest
 
 from pandas import DataFrame
 
-from src.converters.utility import convert_yards_to_coordinates, get_x_cols, convert_x_y_cols, convert_yards_to_degrees
+from src.converters.geodesy import convert_yards_to_degrees, convert_yards_to_degrees_array
+from src.converters.utility import convert_yards_to_coordinates, get_x_cols, convert_x_y_cols, LATITUDE, LONGITUDE
 from src.converters.yards2coordinates_converter import YardsToCoordinatesConverter
+from src.models.utility import format_frame
+import numpy as np
 import pandas as pd
 
 
@@ -64,7 +67,12 @@ class YardsToCoordinatesConverterTests(unittest.TestCase):
         Should correctly convert X and Y yards to d in a DF
         """
 
-        actual = convert_x_y_cols(self.df, self.tact_scenario, list(self.df.columns)).values.tolist()
+        df = convert_x_y_cols(self.df, self.tact_scenario, list(self.df.columns))
+
+        self.assertAlmostEqual(50.0823795014, df['POS1 X'][0], places=10)
+
+        actual = format_frame(df, {'POS1 X': LATITUDE, 'POS1 Y': LONGITUDE,
+                                   'X POS2': LATITUDE, 'Y POS2': LONGITUDE}).values.tolist()
         expect = [['N 50° 04\' 57"', 'W 005° 14\' 34"', 'N 50° 04\' 57"', 'W 005° 14\' 35"', -793.2684, 93.98272, 1]]
 
         self.assertEqual(expect, actual)
@@ -75,9 +83,9 @@ class YardsToCoordinatesConverterTests(unittest.TestCase):
         """
 
         converter = YardsToCoordinatesConverter()
-        actual = converter.convert(self.df,
-                                   tact_scenario=self.tact_scenario,
-                                   scientific_cols=list(self.df.columns)).values.tolist()
+        df = converter.convert(self.df, tact_scenario=self.tact_scenario, scientific_cols=list(self.df.columns))
+
+        actual = format_frame(df, converter.get_formats('CONTACT', list(df.columns), list(df.columns))).values.tolist()
         expect = [['N 50° 04\' 57"', 'W 005° 14\' 34"', 'N 50° 04\' 57"', 'W 005° 14\' 35"', -793.2684, 93.98272, 1]]
 
         self.assertEqual(expect, actual)
@@ -91,3 +99,40 @@ class YardsToCoordinatesConverterTests(unittest.TestCase):
         expect = (0, 0)
 
         self.assertEqual(expect, actual)
+
+    def test_convert_yards_to_degrees_array(self):
+        """
+        Should convert columns of X and Y yards like the scalar conversion
+        """
+        x = np.array([36.94333, 13.64571, -793.2684, 0, np.nan])
+        y = np.array([-258.8558, -248.5793, 93.98272, 12.5, 1])
+        tact_lat = np.full(len(x), self.lat)
+        tact_long = np.full(len(x), self.long)
+
+        lat, long = convert_yards_to_degrees_array(x, y, tact_lat, tact_long)
+
+        for i in range(4):
+            expect = convert_yards_to_degrees(x[i], y[i], self.lat, self.long)
+            self.assertAlmostEqual(expect[0], lat[i], places=10)
+            self.assertAlmostEqual(expect[1], long[i], places=10)
+        self.assertTrue(np.isnan(lat[4]) and np.isnan(long[4]))
+
+    def test_convert_x_y_cols_references(self):
+        """
+        Should convert every row with the grid center of its own tactical scenario
+        """
+        df = pd.DataFrame({'POS X': [36.94333, 36.94333, np.nan], 'POS Y': [-258.8558, -258.8558, 1.0],
+                           'REFERENCE': [1, 2, 1]})
+        tact_scenario = pd.DataFrame({'GRID CENTER LAT': [self.lat, -self.lat],
+                                      'GRID CENTER LONG': [self.long, -self.long],
+                                      'REFERENCE': [1, 2]})
+
+        actual = format_frame(convert_x_y_cols(df, tact_scenario, ['POS X', 'POS Y']),
+                              {'POS X': LATITUDE, 'POS Y': LONGITUDE}).values.tolist()
+
+        self.assertEqual(['N 50° 04\' 57"', 'W 005° 14\' 34"', 1], actual[0])
+        self.assertEqual(['S 50° 05\' 12"', 'E 005° 14\' 38"', 2], actual[1])
+        self.assertTrue(pd.isna(actual[2][0]) and pd.isna(actual[2][1]))
+
+        with self.assertRaises(IndexError):
+            convert_x_y_cols(df, tact_scenario[tact_scenario['REFERENCE'] == 1], ['POS X', 'POS Y'])
@@ -1,6 +1,9 @@
 import unittest
+import numpy as np
 import pandas as pd
 
+from src.converters.utility import round_values
+
 from src.converters.yards_to_nm_converter import get_yard_cols, yards_to_nm, convert_yards_to_nm, YardsToNMConverter
 
 
@@ -64,3 +67,27 @@ class YardsToNMTests(unittest.TestCase):
         expect = [[2.469, 2.962, 3.456, 3.95, 4.444]]
 
         self.assertEqual(expect, actual)
+
+    def test_convert_missing_values(self):
+        """
+        Should keep missing values missing and log values which can not be converted once per column
+        """
+        df = pd.DataFrame({'RANGE': [5000, np.nan, 'x']})
+
+        with self.assertLogs(YardsToNMConverter.logger, 'ERROR') as logs:
+            actual = convert_yards_to_nm(df, ['RANGE'])['RANGE'].tolist()
+
+        self.assertEqual(2.469, actual[0])
+        self.assertTrue(np.isnan(actual[1]) and np.isnan(actual[2]))
+        self.assertEqual(1, len(logs.output))
+
+    def test_round_values(self):
+        """
+        Should round arrays like round, also values close to a half
+        """
+        values = np.array([0.0005, 5.0045, 2.675, 1.0015, -0.0005, np.nan, np.inf, 1e20])
+
+        for decimals in [2, 3]:
+            with self.subTest(decimals=decimals):
+                expect = [round(value, decimals) for value in values]
+                np.testing.assert_array_equal(expect, round_values(values, decimals))
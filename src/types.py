@@ -1,5 +1,10 @@
 from typing import Dict
 
+from pandas import DataFrame
+
 from src.models.dataframe_model import DataFrameModel
 
 MerData = Dict[str, DataFrameModel]
+
+# a DataFrame for every identifier of a single imported Mer
+ImportData = Dict[str, DataFrame]
@@ -6,6 +6,7 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtWidgets import QWidget, QGridLayout, QSizePolicy, QApplication
 
 from src.models.dataframe_model import DataFrameModel
+from src.models.utility import format_frame
 from src.views.dataframeview.datatable_view import DataTableView
 from src.views.dataframeview.header_view import HeaderView
 from src.views.dataframeview.headernames_view import HeaderNamesView
@@ -170,7 +171,8 @@ class DataframeView(QWidget):
             cols = [ix.column() for ix in indexes]
 
             if rows and cols:
-                df = self.dfm.df.iloc[min(rows): max(rows) + 1, min(cols): max(cols) + 1]
+                df = format_frame(self.dfm.df.iloc[min(rows): max(rows) + 1, min(cols): max(cols) + 1],
+                                  self.dfm.formats)
 
                 # copy to clipboard
                 threading.Thread(target=lambda x: x.to_clipboard(index=False, header=header), args=(df,)).start()
@@ -1,6 +1,8 @@
 import sys
+from typing import Union, Tuple
 
 from PyQt5 import QtWidgets
+from PyQt5.QtCore import QModelIndex
 from PyQt5.QtWidgets import QSplitter
 
 from src.models.dataframe_model import DataFrameModel
@@ -28,6 +30,22 @@ class ExplorerView(QSplitter):
 
         self.setSizes([700, 300])
 
+    def show_cell(self, row: int, name: str) -> None:
+        """
+        Select a cell of the unfiltered DataFrame, the filters and column toggle which hide it are reset
+        """
+        dfm: DataFrameModel = self.viewer.dfm
+        position: Union[Tuple[int, int], None] = dfm.get_position(row, name)
+
+        if position is None:
+            self.filter.reset_filters()
+            self.filter.show_column(name)
+            position = dfm.get_position(row, name)
+
+        index: QModelIndex = self.viewer.data_view.model().index(*position)
+        self.viewer.data_view.setCurrentIndex(index)
+        self.viewer.data_view.scrollTo(index)
+
 
 if __name__ == "__main__":
     app = QtWidgets.QApplication(sys.argv)
@@ -1,7 +1,7 @@
 import sys
 from typing import List, Union
 
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtWidgets import QFormLayout, QVBoxLayout, QScrollArea, QWidget, \
     QPushButton, QApplication, QTabWidget, QListWidget, QListWidgetItem, QCheckBox
 
@@ -9,8 +9,12 @@ from src.dataclasses.filterfield import Field
 from src.models.dataframe_model import DataFrameModel
 import pandas as pd
 
+from src.tasks.filter_task import FilterTask
 from src.utility import get_exception
 
+# milliseconds without typing before a filter is applied
+FILTER_DEBOUNCE: int = 150
+
 
 class FilterTabView(QWidget):
     def __init__(self, dfm: DataFrameModel):
@@ -26,6 +30,13 @@ class FilterTabView(QWidget):
         self.column_view: QListWidget = QListWidget()
         self.select_all_box: Union[QCheckBox, None] = None
 
+        # filters are applied in the background once typing pauses
+        self.filter_tasks: List[FilterTask] = list()
+        self.filter_timer: QTimer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(FILTER_DEBOUNCE)
+        self.filter_timer.timeout.connect(self.start_filter)
+
         self.init_fields()
 
         self.init_ui()
@@ -91,10 +102,13 @@ class FilterTabView(QWidget):
         """
         Reset all filters
         """
-        self.dfm.reset_filters()
         for f in self.fields:
             f.reset_field()
 
+        # resetting the fields does not have to be filtered in the background as well
+        self.filter_timer.stop()
+        self.dfm.reset_filters()
+
     def toggle_columns(self, state: Qt.CheckState):
         """
         Toggle all columns in once
@@ -106,10 +120,30 @@ class FilterTabView(QWidget):
 
     def set_filter(self, f: Field) -> None:
         """
-        Apply a filter
+        Apply a filter, an evaluation of the previous expression is cancelled
         """
         self.dfm.set_filter(f.name, f.filter_field.text(), f.filter_active.isChecked())
-        self.dfm.apply_filters()
+        self.dfm.cancel_filters()
+        self.filter_timer.start()
+
+    def start_filter(self) -> None:
+        """
+        Evaluate the filters in the background
+        """
+        task: FilterTask = FilterTask(self.dfm)
+        task.finished.connect(lambda: self.filter_tasks.remove(task))
+
+        self.filter_tasks.append(task)
+        task.start()
+
+    def show_column(self, name: str) -> None:
+        """
+        Activate a column
+        """
+        for f in self.fields:
+            if f.name == name and f.column_field.checkState() != Qt.Checked:
+                f.column_field.setCheckState(Qt.Checked)
+                self.set_column(f.column_field)
 
     def set_column(self, item: QListWidgetItem) -> None:
         """
@@ -118,7 +152,6 @@ class FilterTabView(QWidget):
         try:
             self.dfm.set_column(item.text(), item.checkState())
 
-            self.dfm.apply_filters()
             self.check_all_checked()
         except Exception as e:
             print(get_exception(e))
@@ -48,6 +48,12 @@ help_text = """
     <li>Press &lsquo;Reset filters&rsquo; to undo all filters</li>
     <li>Select or deselect a filter&rsquo;s checkbox to enable or disable it</li>
 </ul>
+<p><b>Search all identifiers</b></p>
+<ul>
+    <li>Edit &gt; Search, available once the imported Mer has been indexed</li>
+    <li>Enter a search term to find the cells of all identifiers which contain it</li>
+    <li>Select a hit to show its cell</li>
+</ul>
 <p><b>Search identifiers</b></p>
 <ul>
     <li>Enter search term in the search box of the identifier panel (left) to search for identifiers</li>
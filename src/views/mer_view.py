@@ -6,11 +6,13 @@ from PyQt5.QtWidgets import QSplitter, QStackedWidget, QLabel, QStatusBar, \
     QProgressBar, QDialog, QMainWindow, QAction, QMessageBox, QMenuBar, QMenu, QFileDialog
 
 from src.dataclasses.menuitem import MenuItem
+from src.dataclasses.search_hit import SearchHit
 from src.environment import environment
 from src.views.bulk_export_dlg import BulkExportDialog
 from src.views.explorer_view import ExplorerView
 from src.views.help_dlg import HelpDialog
 from src.views.identifier_view import IdentifierListView
+from src.views.search_dlg import SearchDialog
 
 themes = ['dark_teal.xml',
           'light_teal.xml']
@@ -47,6 +49,9 @@ class MerView(QMainWindow):
 
         self.help_dlg: HelpDialog = HelpDialog(self)
 
+        self.search_dlg: SearchDialog = SearchDialog(self)
+        self.search_dlg.hit_selected_signal.connect(self.show_hit)
+
         self.init_ui()
 
     def init_ui(self):
@@ -94,6 +99,7 @@ class MerView(QMainWindow):
         self.toggle_export_func(False)
         self.toggle_copy_func(False)
         self.toggle_import_menu(True)
+        self.set_search_index(None)
 
     def create_menu_bar(self):
         menu_bar: QMenuBar = self.menuBar()
@@ -123,6 +129,10 @@ class MerView(QMainWindow):
                       MenuItem(name='Copy with header',
                                func=lambda x: self.copy(True),
                                shortcut='Ctrl+shift+C',
+                               items=[]),
+                      MenuItem(name='Search',
+                               func=self.show_search_dlg,
+                               shortcut='Ctrl+F',
                                items=[])
                       ],
              'Settings': [MenuItem(name='Theme',
@@ -161,6 +171,7 @@ class MerView(QMainWindow):
 
         self.toggle_export_func(False)
         self.toggle_copy_func(False)
+        self.toggle_search_func(False)
 
     def create_progress_window(self):
         self.progress_window.setWindowModality(Qt.ApplicationModal)
@@ -279,6 +290,34 @@ class MerView(QMainWindow):
         # edit > copy with header
         self.menuBar().children()[2].actions()[1].setEnabled(enable)
 
+    def toggle_search_func(self, enable: bool):
+        """
+        Search func is disabled until the imported Mer is indexed
+        """
+        # edit > search
+        self.menuBar().children()[2].actions()[2].setEnabled(enable)
+
+    def set_search_index(self, search_index):
+        """
+        Search the imported Mer with a search index, None when nothing can be searched
+        """
+        self.search_dlg.set_search_index(search_index)
+        self.toggle_search_func(search_index is not None)
+
+        if search_index is None:
+            self.search_dlg.hide()
+
+    def show_search_dlg(self):
+        self.search_dlg.show()
+        self.search_dlg.searchbar.setFocus()
+
+    def show_hit(self, hit: SearchHit):
+        """
+        Put the Explorer of a search hit on top of the stacked widget and select the cell
+        """
+        self.set_identifier(hit.identifier)
+        self.explorers[hit.identifier].show_cell(hit.row, hit.column)
+
     def set_theme(self, name: str):
         """
         Apply theme stylesheet
@@ -0,0 +1,57 @@
+from typing import List, Union
+
+from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLineEdit, QListWidget, QLabel, QListWidgetItem
+
+from src.dataclasses.search_hit import SearchHit
+from src.models.search_index import SearchIndex
+
+
+class SearchDialog(QDialog):
+    hit_selected_signal: pyqtSignal = pyqtSignal(object)
+
+    def __init__(self, parent):
+        super(SearchDialog, self).__init__(parent)
+
+        self.setWindowTitle('Search')
+        self.setGeometry(750, 200, 500, 450)
+        self.setWindowFlag(Qt.WindowContextHelpButtonHint, False)
+
+        self.search_index: Union[SearchIndex, None] = None
+        self.hits: List[SearchHit] = list()
+
+        self.searchbar: QLineEdit = QLineEdit('')
+        self.searchbar.setPlaceholderText('Search all identifiers')
+        self.searchbar.textChanged.connect(self.search)
+
+        self.hit_count: QLabel = QLabel()
+
+        self.hit_list: QListWidget = QListWidget()
+        self.hit_list.itemActivated.connect(self.select_hit)
+        self.hit_list.itemClicked.connect(self.select_hit)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(self.searchbar)
+        main_layout.addWidget(self.hit_count)
+        main_layout.addWidget(self.hit_list)
+        self.setLayout(main_layout)
+        self.hide()
+
+    def set_search_index(self, search_index: Union[SearchIndex, None]) -> None:
+        self.search_index = search_index
+        self.search(self.searchbar.text())
+
+    def search(self, txt: str) -> None:
+        """
+        Show the cells of all identifiers which contain the search term
+        """
+        self.hit_list.clear()
+        self.hits, total = self.search_index.search(txt) if self.search_index is not None else (list(), 0)
+
+        for hit in self.hits:
+            self.hit_list.addItem(QListWidgetItem(str(hit)))
+
+        self.hit_count.setText('{0} hits, showing {1}'.format(total, len(self.hits)) if txt else '')
+
+    def select_hit(self, item: QListWidgetItem) -> None:
+        self.hit_selected_signal.emit(self.hits[self.hit_list.row(item)])